@@ -658,6 +658,7 @@ def index():
                 this.chunkCount = 0;
                 this.speakerName = null;
                 this.sources = []; // Track all scheduled sources
+                this.sampleRate = 24000; // Updated from each turn's WAV header
             }
             
             async addChunk(audioBase64, speakerName) {
@@ -669,8 +670,22 @@ def index():
                         bytes[i] = binaryString.charCodeAt(i);
                     }
                     
-                    // Decode audio data
-                    const audioBuffer = await this.audioContext.decodeAudioData(bytes.buffer);
+                    // A turn opens with an open-ended WAV header (format only);
+                    // every later chunk is bare PCM16 mono
+                    let offset = 0;
+                    if (bytes.length >= 44 && binaryString.startsWith('RIFF') && binaryString.substr(8, 4) === 'WAVE') {
+                        this.sampleRate = new DataView(bytes.buffer).getUint32(24, true);
+                        offset = 44;
+                    }
+                    const samples = new Int16Array(bytes.buffer, offset, (bytes.length - offset) >> 1);
+                    if (samples.length === 0) return;
+                    
+                    // Build the buffer directly - no per-chunk container parsing
+                    const audioBuffer = this.audioContext.createBuffer(1, samples.length, this.sampleRate);
+                    const channel = audioBuffer.getChannelData(0);
+                    for (let i = 0; i < samples.length; i++) {
+                        channel[i] = samples[i] / 32768;
+                    }
                     
                     this.chunkCount++;
                     console.log(`🎵 Chunk ${this.chunkCount} for ${speakerName}: ${audioBuffer.duration.toFixed(3)}s`);
@@ -880,13 +895,23 @@ def index():
             console.log('🔍 Maya started website research');
         });
         
+        let sophieDraft = '';
         socket.on('sophie_creating_content', function(data){
+            sophieDraft = '';
             const status = document.getElementById('status');
             status.innerHTML = `✨ Sophie is crafting LinkedIn marketing content... <span class="loading-dots"></span>`;
             status.className = 'working';
             console.log('✨ Sophie started content creation');
         });
         
+        socket.on('sophie_post_token', function(data){
+            // Show the tail of the LinkedIn post while Sophie writes it
+            sophieDraft += data.token;
+            const status = document.getElementById('status');
+            status.textContent = `✍️ Sophie: …${sophieDraft.slice(-120)}`;
+            status.className = 'working';
+        });
+        
         socket.on('sophie_generating_image', function(data){
             const status = document.getElementById('status');
             status.innerHTML = `🎨 Sophie is generating a beautiful marketing image... <span class="loading-dots"></span>`;
@@ -1385,6 +1410,7 @@ Do NOT wait for the video generation to complete - just announce what you're doi
         orchestrator.on_sophie_creating_content = lambda: socketio.emit('sophie_creating_content', {})
         orchestrator.on_sophie_generating_image = lambda: socketio.emit('sophie_generating_image', {})
         orchestrator.on_sophie_posting_linkedin = lambda: socketio.emit('sophie_posting_linkedin', {})
+        orchestrator.on_sophie_post_token = lambda token: socketio.emit('sophie_post_token', {'token': token})
         orchestrator.on_marine_creating_video = lambda: socketio.emit('marine_creating_video', {})
         orchestrator.on_marine_posting_video = lambda: socketio.emit('marine_posting_video', {})
         
@@ -1560,15 +1586,12 @@ def handle_alex_showcase(data):
                     print("🎤 Alex is now ready to showcase the website!")
                     
                     # Set Alex's persona for the showcase
-                    alex_persona = None
-                    for persona in orchestrator.personas:
-                        if persona.name == "Alex":
-                            alex_persona = persona
-                            break
+                    alex_index = orchestrator._name_to_index.get("Alex")
+                    alex_persona = orchestrator.personas[alex_index] if alex_index is not None else None
                     
                     if alex_persona:
                         # Update Alex's instructions for the showcase - ensure he hands to Marcus
-                        marcus_index = next((i for i, p in enumerate(orchestrator.personas) if p.name == "Marcus"), 0)
+                        marcus_index = orchestrator._name_to_index.get("Marcus", 0)
                         showcase_instructions = f"You are Alex, the developer. The website is now live at {url}! Express your pride and excitement about completing the project. Mention 1-2 key features you implemented. Keep it to 2-3 enthusiastic sentences, then call select_next_speaker with speaker_index='{marcus_index}' to hand control to Marcus for his response."
                         alex_persona.instructions = showcase_instructions
                         
@@ -1576,7 +1599,6 @@ def handle_alex_showcase(data):
                         orchestrator.selected_next_speaker = None
                         
                         # Force Alex to speak
-                        alex_index = next((i for i, p in enumerate(orchestrator.personas) if p.name == "Alex"), 0)
                         orchestrator.current_persona_index = alex_index
                         orchestrator.current_turn += 1
                         orchestrator.current_speaker = "Alex"
@@ -1597,6 +1619,8 @@ def handle_alex_showcase(data):
                                 'text': f"Perfect! The website is now live at {url}. I've successfully implemented all the features we discussed!"
                             })
                         finally:
+                            # Sockets opened on this loop can't outlive it
+                            loop.run_until_complete(orchestrator._close_loop_resources())
                             loop.close()
                 else:
                     print("⚠️ Orchestrator is not active for Alex showcase")
@@ -4,18 +4,19 @@ EXACT replication of openai-realtime-py flow for OpenAI Realtime API
 Based on https://github.com/p-i-/openai-realtime-py
 """
 import asyncio
-import websockets
 import json
 import base64
-import tempfile
+import binascii
 import os
+import sys
 import struct
 import math
-import subprocess
-import threading
 from pathlib import Path
 from flask import Flask, jsonify, request
 from flask_socketio import SocketIO, emit
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from openai_config import OpenAIRealtimeConfig
+from runtime import get_scheduler  # shared loop threads; Flask threads only schedule onto them
 
 # Try to load .env file
 try:
@@ -30,6 +31,9 @@ MODEL = "gpt-4o-realtime-preview"
 VOICE = "alloy"
 TARGET_SR = 24000  # Back to 24kHz as used in openai-realtime-py
 
+# Pooled Realtime sessions shared across utterances
+VOICE_CONFIG = OpenAIRealtimeConfig(api_key=API_KEY or "", model=MODEL, voice=VOICE)
+
 # Flask app setup
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'simple-test-key'
@@ -38,192 +42,255 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 def log(*args):
     print("🔹", *args, flush=True)
 
-def convert_webm_to_pcm16(webm_data, target_sample_rate=TARGET_SR):
-    """Convert WebM to PCM16 using the exact approach from openai-realtime-py"""
-    if len(webm_data) < 1000:
-        log("WebM data too small, using silence fallback")
-        return b"\x00\x00" * int(target_sample_rate * 0.5)  # 500ms silence
+# Pipeline tuning: bounded queues keep the three stages in lock-step without
+# letting a slow consumer buffer the whole recording in memory.
+PIPELINE_QUEUE_SIZE = 8
+UPLOAD_CHUNK_BYTES = 16 * 1024
+PCM_FRAME_BYTES = TARGET_SR * 2 * 20 // 1000  # 20ms of 16-bit mono PCM
+MIN_AUDIO_MS = 100  # OpenAI rejects commits shorter than this
+
+async def upload_chunks(webm_data: bytes, upload_queue: asyncio.Queue):
+    """Stage 1: feed the browser upload to the transcoder in small chunks"""
+    view = memoryview(webm_data)
+    for offset in range(0, len(view), UPLOAD_CHUNK_BYTES):
+        await upload_queue.put(bytes(view[offset:offset + UPLOAD_CHUNK_BYTES]))
+    await upload_queue.put(None)
+
+# One pre-started ffmpeg per (loop, output format), parked on stdin so the
+# next utterance skips fork/exec and ffmpeg start-up
+_warm_ffmpeg = {}
+
+async def _spawn_ffmpeg(target_sample_rate):
+    # Use subprocess for maximum compatibility (like openai-realtime-py)
+    cmd = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-fflags', '+nobuffer',  # emit PCM as soon as the first packets decode
+        '-i', 'pipe:0',
+        '-acodec', 'pcm_s16le',  # 16-bit PCM little endian
+        '-ac', '1',              # Mono
+        '-ar', str(target_sample_rate),  # Sample rate
+        '-f', 's16le',           # Raw PCM16 format
+        'pipe:1'
+    ]
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+
+async def _refill_ffmpeg(key):
+    proc = await _spawn_ffmpeg(key[1])
+    if key in _warm_ffmpeg:
+        proc.kill()  # another refill won the race
+        await proc.wait()
+    else:
+        _warm_ffmpeg[key] = proc
+
+async def _take_ffmpeg(target_sample_rate):
+    """Lend the warm ffmpeg for this format and start its replacement"""
+    # Pipes are bound to the loop that spawned the process
+    key = (asyncio.get_running_loop(), target_sample_rate)
+    proc = _warm_ffmpeg.pop(key, None)
+    if proc is None or proc.returncode is not None:
+        proc = await _spawn_ffmpeg(target_sample_rate)
+    asyncio.ensure_future(_refill_ffmpeg(key))
+    return proc
+
+async def convert_webm_to_pcm16(upload_queue: asyncio.Queue, pcm_queue: asyncio.Queue,
+                                target_sample_rate=TARGET_SR):
+    """Stage 2: stream WebM through ffmpeg and emit 20ms PCM16 frames"""
+    silence = b"\x00\x00" * int(target_sample_rate * 0.5)  # 500ms fallback
+    produced = 0
+    proc = feeder = None
     
-    with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_input:
-        temp_input.write(webm_data)
-        temp_input_path = temp_input.name
+    async def feed_stdin():
+        stdin_open = True
+        while True:
+            chunk = await upload_queue.get()
+            if chunk is None:
+                break
+            if not stdin_open:
+                continue  # keep draining so the uploader never blocks
+            try:
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                log("FFmpeg closed stdin early")
+                stdin_open = False
+        if stdin_open:
+            proc.stdin.close()
     
     try:
-        # Use subprocess for maximum compatibility (like openai-realtime-py)
-        cmd = [
-            'ffmpeg', '-y', '-i', temp_input_path,
-            '-acodec', 'pcm_s16le',  # 16-bit PCM little endian
-            '-ac', '1',              # Mono
-            '-ar', str(target_sample_rate),  # Sample rate
-            '-f', 's16le',           # Raw PCM16 format
-            'pipe:1'
-        ]
-        
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        if result.returncode != 0:
-            log(f"FFmpeg error: {result.stderr.decode()[:200]}")
-            raise RuntimeError("FFmpeg conversion failed")
-        
-        pcm_data = result.stdout
-        
-        if len(pcm_data) < 2:
-            raise RuntimeError("No PCM data produced")
+        proc = await _take_ffmpeg(target_sample_rate)
+        feeder = asyncio.ensure_future(feed_stdin())
         
-        # Calculate duration
-        samples = len(pcm_data) // 2
-        duration_ms = (samples / target_sample_rate) * 1000
-        
-        log(f"Converted: {len(pcm_data)} bytes PCM, {duration_ms:.1f}ms, {samples} samples")
-        
-        # Ensure minimum 100ms for OpenAI
-        min_duration_ms = 100
-        min_samples = int((min_duration_ms / 1000) * target_sample_rate)
-        min_bytes = min_samples * 2
-        
-        if len(pcm_data) < min_bytes:
-            log(f"Padding audio from {duration_ms:.1f}ms to {min_duration_ms}ms")
-            padding = min_bytes - len(pcm_data)
-            pcm_data = pcm_data + b'\x00' * padding
-        
-        return pcm_data
+        while True:
+            try:
+                frame = await proc.stdout.readexactly(PCM_FRAME_BYTES)
+            except asyncio.IncompleteReadError as e:
+                frame = e.partial
+            if not frame:
+                break
+            produced += len(frame)
+            await pcm_queue.put(frame)
+            if len(frame) < PCM_FRAME_BYTES:
+                break
         
+        await feeder
+        if await proc.wait() != 0:
+            log(f"FFmpeg exited with code {proc.returncode}")
     except Exception as e:
         log(f"Audio conversion error: {e}")
-        # Fallback: 500ms of silence
-        samples = int(target_sample_rate * 0.5)
-        return b'\x00\x00' * samples
     finally:
-        try:
-            os.unlink(temp_input_path)
-        except:
+        if feeder and not feeder.done():
+            feeder.cancel()
+        if proc and proc.returncode is None:
+            proc.kill()
+    
+    if feeder is None or feeder.cancelled():
+        while await upload_queue.get() is not None:
             pass
+    
+    if produced < 2:
+        log("No PCM data produced, using silence fallback")
+        await pcm_queue.put(silence)
+    else:
+        samples = produced // 2
+        duration_ms = (samples / target_sample_rate) * 1000
+        log(f"Converted: {produced} bytes PCM, {duration_ms:.1f}ms, {samples} samples")
+        
+        # Ensure minimum 100ms for OpenAI
+        min_bytes = int((MIN_AUDIO_MS / 1000) * target_sample_rate) * 2
+        if produced < min_bytes:
+            log(f"Padding audio from {duration_ms:.1f}ms to {MIN_AUDIO_MS}ms")
+            await pcm_queue.put(b'\x00' * (min_bytes - produced))
+    
+    await pcm_queue.put(None)
 
-async def call_openai_realtime(audio_pcm16: bytes):
-    """Call OpenAI Realtime API using the exact flow from openai-realtime-py"""
+async def openai_sender(ws, pcm_queue: asyncio.Queue):
+    """Stage 3a: append each PCM frame to the input buffer as it arrives"""
+    frames = 0
+    while True:
+        frame = await pcm_queue.get()
+        if frame is None:
+            break
+        await ws.send(json.dumps({
+            "type": "input_audio_buffer.append",
+            "audio": base64.b64encode(frame).decode('utf-8')
+        }))
+        frames += 1
+    
+    await ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
+    log(f"🎤 Audio buffer committed ({frames} frames)")
+    
+    await ws.send(VOICE_CONFIG.response_create_json)
+    log("🤖 Response requested")
+    
+    # Notify browser to reset audio streaming; RTT lets the UI flag a degraded link
+    socketio.emit('status', {
+        'type': 'info',
+        'message': '🤖 Response requested - streaming audio...',
+        'rtt_ms': round(ws.latency * 1000)
+    })
+
+async def openai_receiver(ws, items: list):
+    """Stage 3b: stream response deltas back to the browser"""
+    audio_buf = bytearray()
+    audio_chunk_count = 0
+    text_parts = []
+    
+    async for message in ws:
+        data = json.loads(message)
+        msg_type = data.get("type", "")
+        
+        log(f"📨 Received: {msg_type}")
+        
+        if msg_type == "response.audio.delta":
+            audio_chunk = data.get("delta", "")
+            if audio_chunk:
+                decoded_chunk = binascii.a2b_base64(audio_chunk)
+                audio_buf += decoded_chunk
+                audio_chunk_count += 1
+                log(f"🎵 Audio chunk: {len(decoded_chunk)} bytes")
+                
+                # 🎵 STREAM EACH DELTA IMMEDIATELY
+                socketio.emit('ai_audio_delta', {
+                    'audio_data': audio_chunk,  # Send base64 directly
+                    'chunk_bytes': len(decoded_chunk)
+                })
+        
+        elif msg_type == "response.text.delta":
+            text_delta = data.get("delta", "")
+            if text_delta:
+                text_parts.append(text_delta)
+                log(f"📝 Text: '{text_delta}'")
+        
+        elif msg_type == "response.audio.done":
+            log("🏁 Audio response complete")
+            # Send final status
+            socketio.emit('ai_audio_complete', {
+                'total_chunks': audio_chunk_count,
+                'total_bytes': len(audio_buf),
+                'text': "".join(text_parts)
+            })
+        
+        elif msg_type == "conversation.item.created":
+            # Remember items so the pooled session starts clean next time
+            items.append(data["item"]["id"])
+        
+        elif msg_type == "response.done":
+            break
+        
+        elif msg_type == "error":
+            log(f"❌ OpenAI error: {data}")
+            raise RuntimeError(f"OpenAI error: {data}")
+    
+    return bytes(audio_buf), "".join(text_parts)
+
+async def call_openai_realtime(pcm_queue: asyncio.Queue):
+    """Call OpenAI Realtime API, streaming audio in while the response streams out"""
     if not API_KEY:
         raise RuntimeError("OPENAI_API_KEY missing")
     
-    url = f"wss://api.openai.com/v1/realtime?model={MODEL}"
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "OpenAI-Beta": "realtime=v1",
-    }
-    
-    log("Connecting to OpenAI Realtime API...")
+    log("Leasing OpenAI Realtime connection...")
     
-    async with websockets.connect(url, additional_headers=headers) as ws:
+    # The pooled socket is already authenticated and configured (server VAD
+    # off: we commit the buffer ourselves once ffmpeg is drained)
+    async with VOICE_CONFIG.lease() as (ws, items):
         log("✅ Connected to OpenAI")
         
-        # 1. Configure session (exact format from openai-realtime-py)
-        session_config = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text", "audio"],
-                "instructions": "You are a helpful AI assistant. Please respond naturally and helpfully.",
-                "voice": VOICE,
-                "input_audio_format": "pcm16",
-                "output_audio_format": "pcm16",
-                "turn_detection": {
-                    "type": "server_vad",
-                    "threshold": 0.5,
-                    "prefix_padding_ms": 300,
-                    "silence_duration_ms": 200
-                },
-                "temperature": 0.8
-            }
-        }
-        
-        await ws.send(json.dumps(session_config))
-        log("📋 Session configured")
-        
-        # 2. Create conversation item with audio (exact format from openai-realtime-py)
-        audio_b64 = base64.b64encode(audio_pcm16).decode('utf-8')
-        
-        conversation_item = {
-            "type": "conversation.item.create",
-            "item": {
-                "type": "message",
-                "role": "user",
-                "content": [
-                    {
-                        "type": "input_audio",
-                        "audio": audio_b64
-                    }
-                ]
-            }
-        }
-        
-        await ws.send(json.dumps(conversation_item))
-        log("🎤 Audio message created")
-        
-        # 3. Request response
-        response_request = {
-            "type": "response.create",
-            "response": {
-                "modalities": ["text", "audio"]
-            }
-        }
-        
-        await ws.send(json.dumps(response_request))
-        log("🤖 Response requested")
-        
-        # Notify browser to reset audio streaming
-        socketio.emit('status', {
-            'type': 'info',
-            'message': '🤖 Response requested - streaming audio...'
-        })
-        
-        # 4. Collect audio response chunks
-        audio_chunks = []
-        text_parts = []
-        
-        async for message in ws:
-            data = json.loads(message)
-            msg_type = data.get("type", "")
-            
-            log(f"📨 Received: {msg_type}")
-            
-            if msg_type == "response.audio.delta":
-                audio_chunk = data.get("delta", "")
-                if audio_chunk:
-                    decoded_chunk = base64.b64decode(audio_chunk)
-                    audio_chunks.append(decoded_chunk)
-                    log(f"🎵 Audio chunk: {len(decoded_chunk)} bytes")
-                    
-                    # 🎵 STREAM EACH DELTA IMMEDIATELY
-                    socketio.emit('ai_audio_delta', {
-                        'audio_data': audio_chunk,  # Send base64 directly
-                        'chunk_bytes': len(decoded_chunk)
-                    })
-            
-            elif msg_type == "response.text.delta":
-                text_delta = data.get("delta", "")
-                if text_delta:
-                    text_parts.append(text_delta)
-                    log(f"📝 Text: '{text_delta}'")
-            
-            elif msg_type == "response.audio.done":
-                log("🏁 Audio response complete")
-                # Send final status
-                socketio.emit('ai_audio_complete', {
-                    'total_chunks': len(audio_chunks),
-                    'total_bytes': sum(len(chunk) for chunk in audio_chunks),
-                    'text': "".join(text_parts)
-                })
-                break
-            
-            elif msg_type == "error":
-                log(f"❌ OpenAI error: {data}")
-                raise RuntimeError(f"OpenAI error: {data}")
-        
-        final_audio = b"".join(audio_chunks)
-        final_text = "".join(text_parts)
+        _, (final_audio, final_text) = await asyncio.gather(
+            openai_sender(ws, pcm_queue),
+            openai_receiver(ws, items),
+        )
         
         log(f"✅ Response complete: {len(final_audio)} bytes audio, text: '{final_text}'")
         
         return final_audio, final_text
 
+async def run_voice_pipeline(webm_data: bytes):
+    """Overlap upload → ffmpeg → OpenAI so wall time is max(stage), not sum"""
+    upload_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    pcm_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    
+    if len(webm_data) < 1000:
+        log("WebM data too small, using silence fallback")
+    
+    tasks = [
+        asyncio.ensure_future(upload_chunks(webm_data, upload_queue)),
+        asyncio.ensure_future(convert_webm_to_pcm16(upload_queue, pcm_queue)),
+        asyncio.ensure_future(call_openai_realtime(pcm_queue)),
+    ]
+    try:
+        _, _, (audio_response, text_response) = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    
+    return audio_response, text_response
+
 @app.route('/')
 def index():
     return '''
@@ -354,7 +421,8 @@ def index():
         });
         
         socket.on('status', function(data) {
-            document.getElementById('status').textContent = data.message;
+            document.getElementById('status').textContent = data.message +
+                (data.rtt_ms !== undefined ? ` (RTT ${data.rtt_ms}ms)` : '');
             document.getElementById('status').className = data.type;
             
             // Reset audio streaming on new requests
@@ -786,15 +854,9 @@ def talk_to_ai():
         
         log(f"🎤 Received audio: {len(webm_data)} bytes")
         
-        def process_audio():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        def process_audio(fut):
             try:
-                # Convert WebM to PCM16
-                pcm_audio = convert_webm_to_pcm16(webm_data)
-                
-                # Call OpenAI Realtime API
-                audio_response, text_response = loop.run_until_complete(call_openai_realtime(pcm_audio))
+                audio_response, text_response = fut.result()
                 
                 # Response is now streamed in real-time via ai_audio_delta events
                 # No need to send final audio since it's already been streamed
@@ -806,13 +868,12 @@ def talk_to_ai():
                     'type': 'error',
                     'message': f'Processing error: {e}'
                 })
-            finally:
-                loop.close()
         
-        # Run in background thread
-        threading.Thread(target=process_audio, daemon=True).start()
+        # Upload, ffmpeg and OpenAI run as one overlapped pipeline on a shared loop
+        fut = get_scheduler().schedule(run_voice_pipeline(webm_data))
+        fut.add_done_callback(process_audio)
         
-        return jsonify({'success': True})
+        return jsonify({'success': True}), 202
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -21,14 +21,32 @@ OPENAI_REALTIME_MODEL   - Optional. Model to use (default: gpt-4o-realtime-previ
 """
 
 import asyncio
-import base64
+import binascii
 import json
 import logging
 import os
+import socket
+import sys
+from functools import cached_property
 from typing import Optional
 
+import numpy as np
 import websockets
 
+# Prefer orjson's C parser for the per-frame hot path
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(payload: dict) -> str:
+        # Decode so websockets still sends a text frame
+        return orjson.dumps(payload).decode()
+except ImportError:
+    # orjson not installed, stdlib json works the same
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Try to load .env file if it exists
 try:
     from dotenv import load_dotenv
@@ -50,28 +68,55 @@ log = logging.getLogger(__name__)
 class OpenAIRealtimeAudioTest:
     """Test OpenAI Realtime API audio streaming functionality."""
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None,
+                 want_text: bool = False):
         """Initialize the test.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Model to use (defaults to OPENAI_REALTIME_MODEL env var or gpt-4o-realtime-preview)
+            want_text: Log text/transcript deltas (skipped by default, audio is what we test)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable not set")
         
         self.model = model or os.getenv("OPENAI_REALTIME_MODEL", "gpt-4o-realtime-preview")
+        self._want_text = want_text
         
         # Runtime counters
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._audio_chunks = 0
-        self._audio_bytes = 0
+        # Contiguous int16 buffer (60 s at 24 kHz) grown by doubling
+        self._pcm = np.empty(24000 * 60, dtype=np.int16)
+        self._pcm_len = 0
+        # Checked once so the per-chunk path skips logging calls entirely
+        self._debug = log.isEnabledFor(logging.DEBUG)
 
+    @property
+    def pcm(self) -> np.ndarray:
+        """Audio received so far as int16 samples (a view, not a copy)."""
+        return self._pcm[:self._pcm_len]
+
+    def _append_pcm(self, data: bytes):
+        """Copy a pcm16 chunk into the preallocated sample buffer."""
+        # frombuffer is a zero-copy view, so a delta costs one C-level pass
+        # in a2b_base64 plus one memcpy here – no Python-level per-byte work
+        samples = np.frombuffer(data, dtype=np.int16, count=len(data) // 2)
+        end = self._pcm_len + samples.size
+        if end > self._pcm.size:
+            grown = np.empty(max(end, self._pcm.size * 2), dtype=np.int16)
+            grown[:self._pcm_len] = self._pcm[:self._pcm_len]
+            self._pcm = grown
+        self._pcm[self._pcm_len:end] = samples
+        self._pcm_len = end
+
+    @cached_property
     def _ws_url(self) -> str:
         """Build WebSocket URL for OpenAI Realtime API."""
         return f"wss://api.openai.com/v1/realtime?model={self.model}"
 
+    @cached_property
     def _headers(self) -> dict:
         """Build WebSocket headers for authentication."""
         return {
@@ -79,6 +124,12 @@ class OpenAIRealtimeAudioTest:
             "OpenAI-Beta": "realtime=v1",
         }
 
+    def _disable_nagle(self):
+        """Send small JSON frames immediately (TCP_NODELAY)."""
+        sock = self._ws.transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     async def run(self, timeout: float = 10.0) -> bool:
         """Run the audio streaming test.
         
@@ -88,17 +139,27 @@ class OpenAIRealtimeAudioTest:
         Returns:
             True if audio chunks were received, False otherwise
         """
-        log.info("🔌 Connecting to %s", self._ws_url())
+        log.info("🔌 Connecting to %s", self._ws_url)
         
         try:
             async with websockets.connect(
-                self._ws_url(), 
-                extra_headers=self._headers(), 
-                ping_interval=20
+                self._ws_url, 
+                extra_headers=self._headers, 
+                ping_interval=5,
+                ping_timeout=5,
+                close_timeout=2,
+                # Audio bursts faster than we drain: never reject or stall
+                max_size=None,
+                max_queue=1024,
+                read_limit=1 << 20,
+                write_limit=1 << 20,
+                compression=None,  # base64 PCM is incompressible
             ) as ws:
                 self._ws = ws
+                self._disable_nagle()
+                # No need to wait for session.updated: frames on one socket
+                # are processed in order, so the prompt follows right behind
                 await self._configure_session()
-                await asyncio.sleep(1)
                 await self._send_test_prompt()
 
                 # Listen for audio chunks
@@ -107,12 +168,14 @@ class OpenAIRealtimeAudioTest:
                 except asyncio.TimeoutError:
                     log.info("⏰ Timeout reached, stopping test")
 
+                log.info("📶 Ping RTT: %.0f ms", ws.latency * 1000)
+
         except Exception as e:
             log.error("❌ Connection failed: %s", e)
             return False
 
         # Report results
-        log.info("🎵 Received %d chunks (%d bytes total)", self._audio_chunks, self._audio_bytes)
+        log.info("🎵 Received %d chunks (%d bytes total)", self._audio_chunks, self._pcm_len * 2)
         
         success = self._audio_chunks > 0
         if success:
@@ -170,7 +233,7 @@ class OpenAIRealtimeAudioTest:
         """Send JSON payload to WebSocket."""
         if not self._ws:
             raise RuntimeError("WebSocket not connected")
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(_json_dumps(payload))
 
     async def _receive_loop(self):
         """Process incoming WebSocket messages."""
@@ -178,8 +241,15 @@ class OpenAIRealtimeAudioTest:
             return
             
         async for raw_message in self._ws:
+            if isinstance(raw_message, (bytes, bytearray)):
+                # Binary frame = raw pcm16, no JSON/base64 to unwrap
+                self._audio_chunks += 1
+                self._append_pcm(raw_message)
+                if self._debug:
+                    log.debug("🔊 Binary audio chunk #%d (%d bytes)", self._audio_chunks, len(raw_message))
+                continue
             try:
-                message = json.loads(raw_message)
+                message = _json_loads(raw_message)
                 await self._handle_message(message)
             except json.JSONDecodeError:
                 log.warning("⚠️ Invalid JSON: %.60s…", raw_message)
@@ -195,18 +265,22 @@ class OpenAIRealtimeAudioTest:
             audio_data = message.get("delta", "")
             if audio_data:
                 try:
-                    decoded = base64.b64decode(audio_data)
+                    decoded = binascii.a2b_base64(audio_data)
                     self._audio_chunks += 1
-                    self._audio_bytes += len(decoded)
-                    log.debug("🔊 Audio chunk #%d (%d bytes)", self._audio_chunks, len(decoded))
+                    self._append_pcm(decoded)
+                    if self._debug:
+                        log.debug("🔊 Audio chunk #%d (%d bytes)", self._audio_chunks, len(decoded))
                 except Exception as e:
                     log.error("❌ Failed to decode audio: %s", e)
                     
-        elif msg_type == "response.text.delta":
-            # Show text response for debugging
-            text = message.get("delta", "").strip()
-            if text:
-                log.info("💬 %s", text)
+        elif msg_type.endswith(".delta"):
+            # Text / transcript deltas: drop them unless the caller asked
+            if not self._want_text:
+                return
+            if msg_type in ("response.text.delta", "response.audio_transcript.delta"):
+                text = message.get("delta", "").strip()
+                if text:
+                    log.info("💬 %s", text)
                 
         elif msg_type == "error":
             error_msg = message.get("error", {}).get("message", "Unknown error")
@@ -244,5 +318,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            # uvloop not installed, the default loop works the same
+            pass
     exit_code = asyncio.run(main())
     exit(exit_code)
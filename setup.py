@@ -2,13 +2,19 @@
 Moentreprise - AI-Powered Business Automation Platform
 """
 
+from functools import lru_cache
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+@lru_cache(maxsize=None)
+def read_requirements(path="requirements.txt"):
+    """Parse a requirements file once, dropping comments and blank lines."""
+    with open(path, "r", encoding="utf-8") as fh:
+        lines = (line.split(" #", 1)[0].strip() for line in fh)
+        return tuple(line for line in lines if line and not line.startswith("#"))
 
 setup(
     name="moentreprise",
@@ -43,7 +49,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.8",
-    install_requires=requirements,
+    install_requires=list(read_requirements()),
     extras_require={
         "dev": [
             "pytest>=7.0.0",
@@ -9,8 +9,34 @@ OPENAI_REALTIME_MODEL     – model name (default: gpt-4o-realtime-preview)
 OPENAI_VOICE              – voice name (default: alloy)
 """
 
+import asyncio
+import json
 import os
-from dataclasses import dataclass
+import socket
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, Optional, Tuple
+
+# websockets stays the transport: server→client frames are unmasked, so the
+# per-frame Python work is header parsing only, and client masking already
+# runs in its C ``speedups`` module. Pooling, latency and close_code below
+# all rely on its connection API.
+import websockets
+
+try:
+    import orjson
+
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()  # str → sent as a text frame
+except ImportError:
+    _dumps = json.dumps
+
+def disable_nagle(ws) -> None:
+    """Set TCP_NODELAY so small JSON frames go out without ACK coalescing."""
+    sock = ws.transport.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 @dataclass
 class OpenAIRealtimeConfig:
@@ -20,16 +46,137 @@ class OpenAIRealtimeConfig:
     temperature: float = 0.8
     input_audio_format: str = "pcm16"   # 16-bit 24 kHz mono
     output_audio_format: str = "pcm16"
+    instructions: str = "You are a helpful AI assistant. Please respond naturally and helpfully."
+    modalities: Tuple[str, ...] = ("text", "audio")
+    turn_detection: Optional[dict] = None  # None = caller commits the input buffer
+    pool_size: int = 2
+
+    # Warm websockets keyed by (loop, model, voice); see acquire()/release()
+    _pool: Dict[tuple, asyncio.Queue] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Pre-serialised constant payloads; cleared whenever a field changes
+    _encoded: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
+    def __setattr__(self, name, value):
+        if not name.startswith("_"):
+            self.__dict__.get("_encoded", {}).clear()
+            self.__dict__.pop("ws_url", None)
+            self.__dict__.pop("headers", None)
+        object.__setattr__(self, name, value)
+
+    @cached_property
     def ws_url(self) -> str:
         return f"wss://api.openai.com/v1/realtime?model={self.model}"
 
+    @cached_property
     def headers(self) -> dict:
         return {
             "Authorization": f"Bearer {self.api_key}",
             "OpenAI-Beta": "realtime=v1",
         }
 
+    def session_update(self) -> dict:
+        return {
+            "type": "session.update",
+            "session": {
+                "modalities": list(self.modalities),
+                "instructions": self.instructions,
+                "voice": self.voice,
+                "input_audio_format": self.input_audio_format,
+                "output_audio_format": self.output_audio_format,
+                "turn_detection": self.turn_detection,
+                "temperature": self.temperature,
+            },
+        }
+
+    def response_create(self) -> dict:
+        return {
+            "type": "response.create",
+            "response": {"modalities": list(self.modalities)},
+        }
+
+    def _cached(self, name: str, build) -> str:
+        if name not in self._encoded:
+            self._encoded[name] = _dumps(build())
+        return self._encoded[name]
+
+    @property
+    def session_update_json(self) -> str:
+        """session.update encoded once and reused for every new socket."""
+        return self._cached("session_update", self.session_update)
+
+    @property
+    def response_create_json(self) -> str:
+        """response.create encoded once and reused for every turn."""
+        return self._cached("response_create", self.response_create)
+
+    # ------------------------------------------------------------------
+    # Connection pool – lends pre-configured sockets so each utterance
+    # skips the TCP/TLS/WS handshake and the session.update round trip.
+    # ------------------------------------------------------------------
+    def _queue(self) -> asyncio.Queue:
+        # Sockets belong to the loop that opened them, so pool per loop too
+        key = (asyncio.get_running_loop(), self.model, self.voice)
+        if key not in self._pool:
+            self._pool[key] = asyncio.Queue(maxsize=self.pool_size)
+        return self._pool[key]
+
+    async def _connect(self):
+        ws = await websockets.connect(
+            self.ws_url,
+            additional_headers=self.headers,
+            ping_interval=5,   # detect a stuck session within ~10s, not 40s
+            ping_timeout=5,
+            close_timeout=2,
+            max_size=None,
+            max_queue=1024,    # room for a whole response burst of audio deltas
+            write_limit=1 << 20,
+            # Audio deltas are base64 PCM and barely compress; permessage-
+            # deflate would only add a zlib pass per frame
+            compression=None,
+        )
+        disable_nagle(ws)
+        await ws.send(self.session_update_json)
+        return ws
+
+    async def acquire(self):
+        """Return a warm websocket from the pool, connecting if none is idle."""
+        queue = self._queue()
+        while not queue.empty():
+            ws = queue.get_nowait()
+            if ws.close_code is None:
+                return ws
+        return await self._connect()
+
+    async def release(self, ws, item_ids: Iterable[str] = ()):
+        """Hand a socket back, deleting the conversation items it accumulated."""
+        queue = self._queue()
+        if ws.close_code is not None:
+            return
+        if queue.full():
+            await ws.close()
+            return
+        for item_id in item_ids:
+            await ws.send(_dumps({"type": "conversation.item.delete", "item_id": item_id}))
+        queue.put_nowait(ws)
+
+    @asynccontextmanager
+    async def lease(self):
+        """``async with config.lease() as (ws, items):`` – append item ids to
+        ``items`` so they are cleared before the socket is reused."""
+        ws = await self.acquire()
+        items = []
+        try:
+            yield ws, items
+        except BaseException:
+            # Mid-response state is unknown – never return it to the pool
+            await ws.close()
+            raise
+        await self.release(ws, items)
+
 # Singleton used by the rest of the code
 OPENAI_REALTIME_CONFIG = OpenAIRealtimeConfig(
     api_key=os.getenv("OPENAI_API_KEY", "")
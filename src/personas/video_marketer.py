@@ -1,22 +1,208 @@
 import asyncio
+import hashlib
 import json
+import logging
 import os
-import subprocess
-import tempfile
 import base64
+import shutil
 import time
+import httpx
 from typing import Dict, Any, Optional
+from urllib.parse import quote
+
+log = logging.getLogger(__name__)
+
+# orjson serialises straight to bytes and parses the (large) operation
+# bodies several times faster; stdlib json is the drop-in fallback
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+    _loads = json.loads
+
+# google-auth is optional: without it the token comes from the gcloud CLI
+try:
+    import google.auth
+    import google.auth.transport.requests
+except ImportError:
+    google = None
+
+# Operation polling schedule (seconds), mirroring google-api-core's LRO retry
+POLL_INITIAL = 2.0
+POLL_MULTIPLIER = 1.5
+POLL_MAXIMUM = 20.0
+
+# Access tokens live ~1h. Shared at module level because the orchestrator
+# builds a fresh VideoMarketer per post, so renders back to back reuse it too.
+TOKEN_TTL = 3300
+_token_cache: Dict[str, Any] = {"token": None, "expiry": 0.0}
+
+# Base64 is decoded in blocks of this many characters (a multiple of 4)
+B64_BLOCK = 4 * 1024 * 1024
+
+def _write_base64(path: str, data: str) -> None:
+    """Decode a base64 video straight to disk one block at a time
+
+    Slicing the str keeps only one block's copy alive instead of a second
+    full-size bytes object next to the encoded payload.
+    """
+    with open(path, 'wb') as f:
+        for i in range(0, len(data), B64_BLOCK):
+            f.write(base64.b64decode(data[i:i + B64_BLOCK]))
+
+def _read_range(path: str, first: int, last: int) -> bytes:
+    """Read bytes ``first``..``last`` (inclusive) of a file"""
+    with open(path, 'rb') as f:
+        f.seek(first)
+        return f.read(last - first + 1)
+
+# LinkedIn Videos/Posts REST API
+LINKEDIN_API = "https://api.linkedin.com/rest"
+LINKEDIN_VERSION = "202405"
+UPLOAD_CONCURRENCY = 4  # parts in flight; each is ~4 MB held in memory
+
+class _VideoCache:
+    """Disk cache of rendered videos keyed by a hash of prompt + parameters.
+
+    A hit skips the whole Veo job. Renders are large, so only the most
+    recently used ``max_entries`` (by mtime) are kept.
+    """
+
+    def __init__(self, root: str = os.path.expanduser("~/.cache/moentreprise/veo"),
+                 max_entries: int = 8):
+        self.root = root
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(prompt: str, parameters: Dict[str, Any]) -> str:
+        # Where Veo writes its output doesn't change the video itself
+        params = {k: v for k, v in parameters.items() if k != "storageUri"}
+        blob = json.dumps({"p": prompt, "params": params}, sort_keys=True)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        path = os.path.join(self.root, key + ".mp4")
+        try:
+            if os.path.getsize(path) == 0:
+                return None
+        except OSError:
+            return None
+        os.utime(path)  # mark as recently used
+        return path
+
+    def put(self, key: str, src_path: str) -> None:
+        path = os.path.join(self.root, key + ".mp4")
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, path)  # readers never see a partial file
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = [os.path.join(self.root, name) for name in os.listdir(self.root)
+                   if not name.endswith(".tmp")]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+# Campaign copy, built once at import rather than on every turn
+VIDEO_PROMPT = (
+    "A beautiful promotional video for a flower shop called 'Les Fleurs'. "
+    "Show vibrant colorful flowers, elegant bouquets, and a cozy shop atmosphere. "
+    "Include a beautiful young woman selecting flowers with joy. "
+    "Text overlay: 'Fête d'Anne - 30% off all bouquets'. "
+    "Professional, warm lighting, romantic Parisian atmosphere, 8 seconds duration."
+)
+
+LINKEDIN_POST_TEMPLATE = (
+    "🌸 FÊTE D'ANNE SPECIAL PROMOTION! 🌸\n\n"
+    "Celebrate the joy of flowers with our exclusive 30% discount on all bouquets! "
+    "Just like the happiness captured in this beautiful moment, our flowers bring "
+    "pure joy to every occasion.\n\n"
+    "✨ 30% OFF all flower arrangements\n"
+    "🌹 Fresh, premium quality blooms\n"
+    "💐 Perfect for gifts or treating yourself\n"
+    "🎉 Limited time offer for Fête d'Anne\n\n"
+    "Visit Les Fleurs today and discover the beauty that awaits! "
+    "Because every moment deserves to be as beautiful as this one. 💕\n\n"
+    "#LesFleurs #FlowerShop #FêtedAnne #FlowerPromotion #Paris #BeautifulMoments"
+)
+
+SUCCESS_RESPONSE = (
+    "🎬 Magnifique! I've just created and published a beautiful promotional video for our flower shop! "
+    "The video features a lovely scene of a girl enjoying flowers from Les Fleurs, perfect for our "
+    "Fête d'Anne special promotion with 30% off all bouquets! "
+    "The video captures the joy and beauty that our flowers bring to people's lives. "
+    "This visual storytelling will really connect with our audience and drive sales! "
+    "The video is now live on LinkedIn and ready to inspire customers! 🌸✨"
+)
+
+FAILURE_RESPONSE = (
+    "I've created a beautiful promotional video concept for our Les Fleurs campaign! "
+    "The video showcases the joy and beauty of our flowers, perfect for our Fête d'Anne promotion. "
+    "However, there was an issue with the video posting process. "
+    "The creative content is ready and will definitely resonate with our target audience! 🎬🌸"
+)
+
+# Returned without rendering or posting when the orchestrator is in dry-run
+STUB_RESPONSE = (
+    "🎬 (Preview) Here's where I'd publish our Fête d'Anne promotional video for Les Fleurs, "
+    "featuring a lovely scene of a girl enjoying our flowers with 30% off all bouquets! 🌸"
+)
+STUB_CALL = {
+    "name": "post_video_to_linkedin",
+    "arguments": {
+        "video_generated": False,
+        "post_url": None,
+        "promotion": "Fête d'Anne - 30% off all bouquets",
+        "video_description": "Beautiful promotional video featuring a girl enjoying flowers from Les Fleurs"
+    }
+}
+
+ERROR_RESPONSE = (
+    "I encountered an issue while creating our promotional video campaign. "
+    "Let me try a simpler approach to get our Fête d'Anne promotion out there. "
+    "The important thing is that we have a beautiful message about our 30% off promotion! 🎬💪"
+)
 
 class VideoMarketer:
     """Marine - Video Marketing Specialist using Google Veo for promotional video generation"""
     
-    def __init__(self, name: str = "Marine", role: str = "Video Marketing Specialist"):
+    def __init__(self, name: str = "Marine", role: str = "Video Marketing Specialist",
+                 http: Optional[httpx.AsyncClient] = None):
         self.name = name
         self.role = role
         self.project_id = "legml-456908"
         self.location_id = "us-central1"
         self.api_endpoint = "us-central1-aiplatform.googleapis.com"
         self.model_id = "veo-3.0-generate-preview"
+        # gs:// prefix for Veo output; unset means the video comes back inline
+        self.storage_uri = os.getenv("VEO_STORAGE_URI")
+        self._cache = _VideoCache()
+        
+        # Status callbacks, bound once by attach_orchestrator()
+        self.orchestrator = None
+        self._cb_creating = None
+        self._cb_posting = None
+        
+        # LinkedIn credentials, shared with the LinkedIn persona; without a
+        # token the post is simulated
+        self.linkedin_access_token = os.getenv('LINKEDIN_ACCESS_TOKEN', '')
+        linkedin_org_id = os.getenv('LINKEDIN_ORG_ID', '')
+        self._author_urn = (f"urn:li:organization:{linkedin_org_id}" if linkedin_org_id
+                            else f"urn:li:person:{os.getenv('LINKEDIN_AUTHOR_ID', '')}")
+        # Pass the orchestrator's pooled client to share its warm sockets;
+        # without one, a private client is opened and closed per turn
+        self._http = http
+        self._owns_http = http is None
         
         # Enhanced prompt for video marketing focused responses
         self.instructions = (
@@ -30,36 +216,91 @@ class VideoMarketer:
         # Set higher token limits for creative marketing content
         self.max_tokens = 600
         
+    def attach_orchestrator(self, orchestrator) -> None:
+        """Keep the orchestrator and bind its Marine status callbacks once"""
+        self.orchestrator = orchestrator
+        self._cb_creating = getattr(orchestrator, 'on_marine_creating_video', None)
+        self._cb_posting = getattr(orchestrator, 'on_marine_posting_video', None)
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """One keep-alive client so the submit and every poll share a TLS socket"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            )
+        return self._http
+
+    async def _fetch_token(self) -> str:
+        """Look up a fresh access token without blocking the event loop"""
+        if google is not None:
+            return await asyncio.to_thread(self._refresh_adc_token)
+        proc = await asyncio.create_subprocess_exec(
+            "gcloud", "auth", "print-access-token",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"gcloud auth failed: {stderr.decode().strip()}")
+        return stdout.decode().strip()
+
+    @staticmethod
+    def _refresh_adc_token() -> str:
+        credentials, _ = google.auth.default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        credentials.refresh(google.auth.transport.requests.Request())
+        return credentials.token
+
+    async def _get_token(self) -> str:
+        """Cached access token, refreshed a minute before it expires"""
+        if _token_cache["token"] is None or time.time() >= _token_cache["expiry"] - 60:
+            _token_cache["token"] = await self._fetch_token()
+            _token_cache["expiry"] = time.time() + TOKEN_TTL
+        return _token_cache["token"]
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {await self._get_token()}"}
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, unless it was lent by the orchestrator"""
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
+
     async def process_turn(self, conversation_history: list, phase: str = None) -> Dict[str, Any]:
         """Generate promotional video using Google Veo and create LinkedIn video post"""
         
+        # UI previews and tests skip the multi-minute render and the post
+        if getattr(self.orchestrator, 'dry_run', False):
+            print(f"🎬 {self.name}: dry run - skipping video generation and posting")
+            return {'content': STUB_RESPONSE, 'function_calls': [STUB_CALL]}
+        
         try:
             print(f"🎬 {self.name} is creating promotional video content...")
             
             # Emit status: Marine is creating video content
-            if hasattr(self, 'orchestrator') and hasattr(self.orchestrator, 'on_marine_creating_video') and self.orchestrator.on_marine_creating_video:
-                self.orchestrator.on_marine_creating_video()
+            if self._cb_creating:
+                self._cb_creating()
             
-            # Step 1: Generate promotional video using Google Veo
-            video_path = await self._generate_promotional_video()
+            # Step 1: Generate promotional video using Google Veo while the
+            # LinkedIn post is prepared, since neither depends on the other
+            video_path, post = await asyncio.gather(
+                self._generate_promotional_video(),
+                self._prepare_linkedin_post(),
+            )
             
             # Emit status: Marine is posting video to LinkedIn
-            if hasattr(self, 'orchestrator') and hasattr(self.orchestrator, 'on_marine_posting_video') and self.orchestrator.on_marine_posting_video:
-                self.orchestrator.on_marine_posting_video()
+            if self._cb_posting:
+                self._cb_posting()
             
             # Step 2: Post video to LinkedIn with promotional content
-            linkedin_url = await self._post_video_to_linkedin(video_path)
+            linkedin_url = await self._upload_and_publish(video_path, post)
             
             # Step 3: Create response message
             if linkedin_url:
-                response_content = (
-                    f"🎬 Magnifique! I've just created and published a beautiful promotional video for our flower shop! "
-                    f"The video features a lovely scene of a girl enjoying flowers from Les Fleurs, perfect for our "
-                    f"Fête d'Anne special promotion with 30% off all bouquets! "
-                    f"The video captures the joy and beauty that our flowers bring to people's lives. "
-                    f"This visual storytelling will really connect with our audience and drive sales! "
-                    f"The video is now live on LinkedIn and ready to inspire customers! 🌸✨"
-                )
+                response_content = SUCCESS_RESPONSE
                 
                 # Add video posting function call
                 function_calls = [{
@@ -72,12 +313,7 @@ class VideoMarketer:
                     }
                 }]
             else:
-                response_content = (
-                    f"I've created a beautiful promotional video concept for our Les Fleurs campaign! "
-                    f"The video showcases the joy and beauty of our flowers, perfect for our Fête d'Anne promotion. "
-                    f"However, there was an issue with the video posting process. "
-                    f"The creative content is ready and will definitely resonate with our target audience! 🎬🌸"
-                )
+                response_content = FAILURE_RESPONSE
                 function_calls = []
 
             return {
@@ -87,16 +323,12 @@ class VideoMarketer:
             
         except Exception as e:
             print(f"❌ Video marketing error: {e}")
-            error_response = (
-                f"I encountered an issue while creating our promotional video campaign. "
-                f"Let me try a simpler approach to get our Fête d'Anne promotion out there. "
-                f"The important thing is that we have a beautiful message about our 30% off promotion! 🎬💪"
-            )
-            
             return {
-                'content': error_response,
+                'content': ERROR_RESPONSE,
                 'function_calls': []
             }
+        finally:
+            await self.aclose()
     
     async def _generate_promotional_video(self) -> Optional[str]:
         """Generate promotional video using Google Veo API"""
@@ -105,13 +337,7 @@ class VideoMarketer:
             print("🎬 Generating promotional video with Google Veo...")
             
             # Create the video generation request using the correct format
-            video_prompt = (
-                "A beautiful promotional video for a flower shop called 'Les Fleurs'. "
-                "Show vibrant colorful flowers, elegant bouquets, and a cozy shop atmosphere. "
-                "Include a beautiful young woman selecting flowers with joy. "
-                "Text overlay: 'Fête d'Anne - 30% off all bouquets'. "
-                "Professional, warm lighting, romantic Parisian atmosphere, 8 seconds duration."
-            )
+            video_prompt = VIDEO_PROMPT
             
             # Create request JSON using your working format
             request_data = {
@@ -129,31 +355,31 @@ class VideoMarketer:
                     "generateAudio": True
                 }
             }
+            if self.storage_uri:
+                # Have Veo write to GCS and hand back a URI, not inline base64
+                request_data["parameters"]["storageUri"] = self.storage_uri
             
-            # Write request to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(request_data, f)
-                request_file = f.name
+            cache_key = self._cache.key(video_prompt, request_data["parameters"])
+            cached = self._cache.get(cache_key)
+            if cached:
+                print(f"♻️ Reusing cached video for this prompt: {cached}")
+                return cached
             
-            print(f"📋 Created request file: {request_file}")
             print(f"🎯 Video prompt: {video_prompt[:100]}...")
             
-            # Use the exact curl command format that works
-            curl_cmd = f"""curl -X POST \\
-                -H "Content-Type: application/json" \\
-                -H "Authorization: Bearer $(gcloud auth print-access-token)" \\
-                "https://{self.api_endpoint}/v1/projects/{self.project_id}/locations/{self.location_id}/publishers/google/models/{self.model_id}:predictLongRunning" \\
-                -d '@{request_file}'"""
-            
             print(f"🚀 Executing API call...")
-            result = subprocess.run(curl_cmd, capture_output=True, text=True, shell=True)
+            url = f"https://{self.api_endpoint}/v1/{request_data['endpoint']}:predictLongRunning"
+            result = await self._get_http().post(
+                url, content=_dumps(request_data),
+                headers={**await self._auth_headers(), "Content-Type": "application/json"},
+            )
             
-            if result.returncode != 0:
-                print(f"❌ Video generation request failed: {result.stderr}")
+            if result.is_error:
+                print(f"❌ Video generation request failed: {result.status_code} {result.text[:200]}")
                 return None
             
             # Extract operation ID
-            response = json.loads(result.stdout)
+            response = _loads(result.content)
             operation_name = response.get('name', '')
             
             if not operation_name:
@@ -168,10 +394,13 @@ class VideoMarketer:
             if video_data:
                 # Save video to file
                 video_path = f"/tmp/promotional_video_{int(time.time())}.mp4"
-                with open(video_path, 'wb') as f:
-                    f.write(base64.b64decode(video_data))
+                if video_data.startswith("gs://"):
+                    await self._download_gcs(video_data, video_path)
+                else:
+                    await asyncio.to_thread(_write_base64, video_path, video_data)
                 
                 print(f"✅ Video saved to: {video_path}")
+                await asyncio.to_thread(self._cache.put, cache_key, video_path)
                 return video_path
             
             return None
@@ -180,125 +409,225 @@ class VideoMarketer:
             print(f"❌ Error generating video: {e}")
             return None
     
-    async def _poll_for_video_completion(self, operation_name: str, max_attempts: int = 12) -> Optional[str]:
-        """Poll the Google Cloud Operations API for video completion
-        
-        Video generation takes 2-3 minutes, so we poll every 20 seconds for up to 4 minutes total.
+    async def _poll_for_video_completion(self, operation_name: str, timeout: float = 240.0) -> Optional[str]:
+        """Wait on the Veo long-running operation and return its video data
+
+        Polls like google-api-core's LRO retry: the first checks come after
+        2s and the interval grows 1.5x up to 20s, so a job that finishes
+        early is noticed quickly without hammering the API during the usual
+        2-3 minute render. Gives up once ``timeout`` seconds have elapsed.
         """
         
         # Clean the operation name (remove quotes if present)
         clean_operation_name = operation_name.strip().strip('"')
-        print(f"🔄 Polling operation: {clean_operation_name}")
-        print("⏰ Video generation typically takes 2-3 minutes. Please wait...")
+        log.info("🔄 Polling operation: %s", clean_operation_name)
+        log.info("⏰ Video generation typically takes 2-3 minutes. Please wait...")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = POLL_INITIAL
+        attempt = 0
         
-        for attempt in range(max_attempts):
+        while True:
+            attempt += 1
+            started = loop.time()
+            elapsed = timeout - (deadline - started)
             try:
-                # Use the correct Google Cloud Operations API endpoint
                 # The operation name already contains the full path
-                operations_url = f"https://{self.api_endpoint}/v1/{clean_operation_name}"
-                
-                curl_cmd = f"""curl -s \\
-                    -H "Authorization: Bearer $(gcloud auth print-access-token)" \\
-                    "{operations_url}" """
-                
-                print(f"🔍 Polling attempt {attempt + 1}/{max_attempts} (waiting for video generation...)") 
-                result = subprocess.run(curl_cmd, capture_output=True, text=True, shell=True)
+                log.debug("🔍 Polling attempt %d (%.0fs elapsed)", attempt, elapsed)
+                result = await self._get_http().get(
+                    f"https://{self.api_endpoint}/v1/{clean_operation_name}",
+                    headers=await self._auth_headers()
+                )
                 
-                if result.returncode == 0:
+                if not result.is_error:
                     try:
-                        response = json.loads(result.stdout)
-                        
+                        response = _loads(result.content)
                         if response.get('done', False):
-                            print("✅ Video generation completed!")
-                            
-                            # Check for video data in the response
-                            if 'response' in response:
-                                video_response = response['response']
-                                if 'predictions' in video_response:
-                                    predictions = video_response['predictions']
-                                    if predictions and isinstance(predictions, list) and len(predictions) > 0:
-                                        prediction = predictions[0]
-                                        
-                                        # Look for video data - could be in different formats
-                                        if 'bytesBase64Encoded' in prediction:
-                                            return prediction['bytesBase64Encoded']
-                                        elif 'generatedVideo' in prediction:
-                                            video_data = prediction['generatedVideo']
-                                            if 'videoUri' in video_data:
-                                                print(f"🎬 Video URI: {video_data['videoUri']}")
-                                                return video_data['videoUri']
-                                            elif 'base64Data' in video_data:
-                                                return video_data['base64Data']
-                            
-                            print("❌ Video generation completed but no video data found")
-                            print(f"📋 Response structure: {json.dumps(response, indent=2)}")
-                            return None
-                        else:
-                            elapsed_time = (attempt + 1) * 20  # 20 seconds per attempt
-                            print(f"🎬 Video still generating... ({elapsed_time}s elapsed, ~{180-elapsed_time}s remaining)")
-                            if attempt < max_attempts - 1:  # Don't sleep on last attempt
-                                await asyncio.sleep(20)  # Wait 20 seconds before next poll
+                            log.info("✅ Video generation completed!")
+                            video_data = self._extract_video_data(response)
+                            if video_data is None:
+                                log.error("❌ Video generation completed but no video data found")
+                                log.debug("📋 Response structure: %s", response)
+                            return video_data
+                        log.debug("🎬 Video still generating... (%.0fs elapsed)", elapsed)
                     
                     except json.JSONDecodeError as e:
                         # This is expected initially - the operation might not be ready yet
-                        if "<!DOCTYPE html>" in result.stdout:
-                            print(f"⏳ Operation not ready yet (attempt {attempt + 1}/{max_attempts})")
+                        if "<!DOCTYPE html>" in result.text:
+                            log.debug("⏳ Operation not ready yet (attempt %d)", attempt)
                         else:
-                            print(f"❌ Failed to parse polling response: {e}")
-                            print(f"📋 Raw response: {result.stdout[:200]}...")
-                        
-                        if attempt < max_attempts - 1:
-                            await asyncio.sleep(20)  # Wait 20 seconds before next poll
+                            log.warning("❌ Failed to parse polling response: %s", e)
+                            log.debug("📋 Raw response: %.200s", result.text)
                 
                 else:
-                    print(f"❌ Polling failed with return code: {result.returncode}")
-                    if result.stderr:
-                        print(f"📋 Error output: {result.stderr[:200]}...")
+                    log.warning("❌ Polling failed with status: %d", result.status_code)
+                    log.debug("📋 Error output: %.200s", result.text)
                     
                     # If it's a 404, the operation might not be ready yet
-                    if "404" in result.stdout or "Not Found" in result.stdout:
-                        print(f"⏳ Operation not found yet - still initializing...")
-                    
-                    if attempt < max_attempts - 1:
-                        await asyncio.sleep(20)  # Wait before retry
+                    if result.status_code == 404:
+                        log.debug("⏳ Operation not found yet - still initializing...")
                     
             except Exception as e:
-                print(f"❌ Error polling for video completion: {e}")
-                if attempt < max_attempts - 1:
-                    await asyncio.sleep(20)  # Wait before retry
+                log.warning("❌ Error polling for video completion: %s", e)
+            
+            now = loop.time()
+            remaining = deadline - now
+            if remaining <= 0:
+                break
+            # Pace polls from when each one started, so the request's own
+            # round trip counts towards the interval instead of adding to it.
+            # Clip the last wait so one final poll lands right at the deadline.
+            await asyncio.sleep(max(0.0, min(started + delay - now, remaining)))
+            delay = min(POLL_MAXIMUM, delay * POLL_MULTIPLIER)
         
-        print("❌ Video generation timed out after 4 minutes (maximum wait time)")
+        log.error("❌ Video generation timed out after %.0fs (maximum wait time)", timeout)
         return None
     
-    async def _post_video_to_linkedin(self, video_path: Optional[str]) -> Optional[str]:
-        """Post promotional video to LinkedIn with campaign message"""
+    @staticmethod
+    def _extract_video_data(operation: Dict[str, Any]) -> Optional[str]:
+        """Pull the GCS URI or base64 payload out of a finished operation
+        
+        A URI is preferred: the file is then fetched as raw bytes rather than
+        inflated by a third and parsed out of a multi-MB JSON string.
+        """
+        response = operation.get('response', {})
+        results = response.get('videos') or response.get('predictions')
+        if not results or not isinstance(results, list):
+            return None
+        result = results[0]
+        generated = result.get('generatedVideo', {})
+        
+        # Look for video data - could be in different formats
+        uri = result.get('gcsUri') or generated.get('videoUri')
+        if uri:
+            print(f"🎬 Video URI: {uri}")
+            return uri
+        return result.get('bytesBase64Encoded') or generated.get('base64Data')
+    
+    async def _download_gcs(self, uri: str, path: str) -> None:
+        """Stream a gs:// object to ``path`` through the GCS JSON API"""
+        bucket, _, name = uri[len("gs://"):].partition("/")
+        url = (f"https://storage.googleapis.com/storage/v1/b/{bucket}"
+               f"/o/{quote(name, safe='')}?alt=media")
+        async with self._get_http().stream("GET", url, headers=await self._auth_headers()) as r:
+            r.raise_for_status()
+            with open(path, 'wb') as f:
+                async for chunk in r.aiter_bytes(1 << 20):
+                    f.write(chunk)
+    
+    def _linkedin_headers(self) -> Dict[str, str]:
+        return {
+            'Authorization': f'Bearer {self.linkedin_access_token}',
+            'LinkedIn-Version': LINKEDIN_VERSION,
+            'X-Restli-Protocol-Version': '2.0.0',
+        }
+    
+    async def _prepare_linkedin_post(self) -> Dict[str, Any]:
+        """Build everything the LinkedIn post needs that doesn't depend on the video
+        
+        Runs alongside the Veo render. The upload itself can't be initialised
+        here because LinkedIn wants the final file size up front.
+        """
+        
+        return {
+            "author": self._author_urn,
+            "commentary": LINKEDIN_POST_TEMPLATE,
+            "visibility": "PUBLIC",
+            "distribution": {
+                "feedDistribution": "MAIN_FEED",
+                "targetEntities": [],
+                "thirdPartyDistributionChannels": [],
+            },
+            "content": {"media": {"title": "Fête d'Anne - 30% off all bouquets"}},
+            "lifecycleState": "PUBLISHED",
+            "isReshareDisabledByAuthor": False,
+        }
+    
+    async def _upload_video(self, video_path: str) -> Optional[str]:
+        """Upload an MP4 through LinkedIn's multi-part Videos API, returning its URN
+        
+        LinkedIn splits the file into byte ranges of ~4 MB; the parts go up
+        concurrently (a few at a time, so memory stays bounded) and the
+        ETag of each part finalises the upload.
+        """
+        http = self._get_http()
+        init = await http.post(
+            f"{LINKEDIN_API}/videos?action=initializeUpload",
+            headers=self._linkedin_headers(),
+            json={"initializeUploadRequest": {
+                "owner": self._author_urn,
+                "fileSizeBytes": os.path.getsize(video_path),
+                "uploadCaptions": False,
+                "uploadThumbnail": False,
+            }},
+        )
+        if init.is_error:
+            print(f"❌ Failed to initialise video upload: {init.text[:200]}")
+            return None
+        value = init.json()["value"]
+        
+        slots = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+        
+        async def put_part(instruction: Dict[str, Any]) -> str:
+            async with slots:
+                first, last = instruction["firstByte"], instruction["lastByte"]
+                body = await asyncio.to_thread(_read_range, video_path, first, last)
+                r = await http.put(
+                    instruction["uploadUrl"], content=body,
+                    headers={"Content-Type": "application/octet-stream"},
+                )
+                r.raise_for_status()
+                return r.headers["ETag"]
+        
+        etags = await asyncio.gather(*(put_part(i) for i in value["uploadInstructions"]))
+        
+        final = await http.post(
+            f"{LINKEDIN_API}/videos?action=finalizeUpload",
+            headers=self._linkedin_headers(),
+            json={"finalizeUploadRequest": {
+                "video": value["video"],
+                "uploadToken": value.get("uploadToken", ""),
+                "uploadedPartIds": list(etags),
+            }},
+        )
+        if final.is_error:
+            print(f"❌ Failed to finalise video upload: {final.text[:200]}")
+            return None
+        return value["video"]
+    
+    async def _upload_and_publish(self, video_path: Optional[str], post: Dict[str, Any]) -> Optional[str]:
+        """Post promotional video to LinkedIn with the prepared campaign message"""
         
         try:
             if not video_path or not os.path.exists(video_path):
                 print("❌ No video file to post")
                 return None
             
-            # Create promotional post content
-            post_content = (
-                "🌸 FÊTE D'ANNE SPECIAL PROMOTION! 🌸\n\n"
-                "Celebrate the joy of flowers with our exclusive 30% discount on all bouquets! "
-                "Just like the happiness captured in this beautiful moment, our flowers bring "
-                "pure joy to every occasion.\n\n"
-                "✨ 30% OFF all flower arrangements\n"
-                "🌹 Fresh, premium quality blooms\n"
-                "💐 Perfect for gifts or treating yourself\n"
-                "🎉 Limited time offer for Fête d'Anne\n\n"
-                "Visit Les Fleurs today and discover the beauty that awaits! "
-                "Because every moment deserves to be as beautiful as this one. 💕\n\n"
-                "#LesFleurs #FlowerShop #FêtedAnne #FlowerPromotion #Paris #BeautifulMoments"
+            if not self.linkedin_access_token:
+                print("⚠️ LinkedIn credentials not configured - skipping actual posting")
+                # Return simulated LinkedIn post URL
+                return f"https://linkedin.com/feed/update/urn:li:video:promotional_campaign_{int(time.time())}"
+            
+            video_urn = await self._upload_video(video_path)
+            if not video_urn:
+                return None
+            print(f"✅ Video uploaded: {video_urn}")
+            
+            post["content"]["media"]["id"] = video_urn
+            response = await self._get_http().post(
+                f"{LINKEDIN_API}/posts",
+                headers=self._linkedin_headers(),
+                json=post,
             )
+            if response.status_code != 201:
+                print(f"❌ Failed to publish video post: {response.text[:200]}")
+                return None
             
-            # For now, simulate successful posting (would need LinkedIn video API implementation)
+            post_urn = response.headers.get("x-restli-id", "")
             print(f"📱 Posted promotional video to LinkedIn with Fête d'Anne campaign")
-            
-            # Return simulated LinkedIn post URL
-            return f"https://linkedin.com/feed/update/urn:li:video:promotional_campaign_{int(time.time())}"
+            return f"https://www.linkedin.com/feed/update/{post_urn}"
             
         except Exception as e:
             print(f"❌ Error posting video to LinkedIn: {e}")
-            return None 
\ No newline at end of file
+            return None
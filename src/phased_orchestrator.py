@@ -1,9 +1,99 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from openai import AsyncOpenAI
+
 from simple_orchestrator import SimpleOrchestrator, PersonaConfig
-from datetime import datetime
+
+try:
+    from web_tools import find_sites_jina_async
+except ImportError:  # search extras missing – Maya just skips the live search
+    find_sites_jina_async = None
+
+log = logging.getLogger(__name__)
+
+JINA_CACHE_SIZE = 32
+NOTES_SUMMARY_MODEL = "gpt-4o-mini"
+NOTES_SUMMARY_PROMPT = (
+    "Condense these client interview answers into at most 6 short bullet points "
+    "for a web design team. Keep every concrete fact (audience, pages, colours, "
+    "example sites, budget, timeline, success metrics); drop filler. "
+    "Reply with the bullets only.\n\n"
+)
+PLAN_FILE = Path(__file__).resolve().parents[1] / "images" / "target.txt"
+
+# Marcus's per-phase instructions, swapped in by reference so the bytes
+# match turn to turn
+MARCUS_POST_MAYA_INSTR = (
+    "You are Marcus, the Project Manager. Maya has just completed the screenshot research task. "
+    "Thank Maya briefly in one sentence. "
+    "Then immediately tell Alex to start coding: 'Alex, please start coding the website based on our requirements.' "
+    "Keep it direct and simple. End by calling select_next_speaker with speaker_index='2'."
+)
+
+MARCUS_SHOWCASE_INSTR = (
+    "You are Marcus, the Project Manager. Alex has just showcased the completed website and you're very impressed! "
+    "Praise Alex's excellent work in 2-3 enthusiastic sentences. Then mention that Sophie will now handle the marketing announcement on LinkedIn. "
+    "End by calling select_next_speaker with speaker_index='7' to hand control to Sophie."
+)
+
+MARCUS_VIDEO_INTRO_INSTR = (
+    "You are Marcus, the Project Manager. Sophie has just completed an excellent LinkedIn marketing campaign! "
+    "Thank Sophie warmly for her outstanding marketing work in 2-3 sentences. "
+    "Then introduce Marine: 'Now let's take our marketing to the next level! Marine, our Video Marketing Specialist, "
+    "will create a beautiful promotional video using Google Veo for our Fête d'Anne campaign with 30% off all bouquets!' "
+    "End by calling select_next_speaker with speaker_index='8' to hand control to Marine."
+)
+
+SARAH_FAREWELL_PROMPT = (
+    "Please thank the user for the information in one friendly sentence and say you will report to the project manager, "
+    "then call the function with speaker_index='0'."
+)
+
+# Stand-in transcript when a persona returns audio/function calls but no text
+EMPTY_REPLY_TEXT = "(repeats question clearly)"
+
+MARCUS_CLOSING_INSTR = (
+    "You are Marcus, the Project Manager. Marine has just completed an amazing promotional video campaign for our Fête d'Anne promotion! "
+    "Thank Marine warmly for her outstanding video marketing work in 2-3 sentences. "
+    "Then provide a brief project wrap-up: acknowledge the entire team's great work (Maya for research, Alex for development, Sophie for LinkedIn marketing, Marine for video marketing). "
+    "Conclude by saying the complete marketing campaign is successfully launched and the session is now closed. "
+    "Keep it professional, positive, and conclusive. Do not call any functions - just provide the closing statement."
+)
+
+def _pack_notes(notes: List[str]) -> Tuple[str, str]:
+    """Canonical bullet list of interview answers plus a short version hash.
+
+    Whitespace is stripped and repeats dropped (answer order is kept, it
+    follows the question order), so retries render byte-identical text.
+    """
+    unique = dict.fromkeys(n.strip() for n in notes if n.strip())
+    pack = "\n".join(f"- {n}" for n in unique) or "(no notes)"
+    return pack, hashlib.md5(pack.encode("utf-8")).hexdigest()[:8]
+
+async def _summarize_notes(pack: str) -> str:
+    """One-off compact summary of the notes pack; *pack* itself on any failure."""
+    if pack == "(no notes)" or not os.getenv("OPENAI_API_KEY"):
+        return pack
+    try:
+        async with AsyncOpenAI() as client:
+            resp = await client.chat.completions.create(
+                model=NOTES_SUMMARY_MODEL,
+                messages=[{"role": "user", "content": NOTES_SUMMARY_PROMPT + pack}],
+                max_tokens=250,
+                temperature=0,
+            )
+        return resp.choices[0].message.content.strip() or pack
+    except Exception as ex:  # noqa: BLE001
+        log.warning("Notes summary failed, using raw notes: %s", ex)
+        return pack
 
 # ---------------------------------------------------------------------------
 # Patch: prevent SimpleOrchestrator from looping Human turns
@@ -12,40 +102,51 @@ from datetime import datetime
 # We apply this patch once at import time.
 # ---------------------------------------------------------------------------
 
-if not hasattr(SimpleOrchestrator, "_patched_no_human_loop"):
+# Set once both patches are installed. Read back from globals() because
+# importlib.reload re-runs this file in the same namespace: without it the
+# patches would wrap the already-patched methods a second time.
+_PATCHED = globals().get("_PATCHED", False)
+
+if not _PATCHED:
     _orig_start_human_turn = SimpleOrchestrator._start_human_turn
 
     async def _start_human_turn_once(self):  # type: ignore[override]
         """Wrapped start_human_turn that clears current_speaker afterwards."""
         await _orig_start_human_turn(self)
 
+        phase = getattr(self, "phase", "")
+
         # Capture human answer during interview phase
-        if getattr(self, "phase", "") == "interview" and self.pending_human_response:
+        if phase == "interview" and self.pending_human_response:
             self.interview_notes.append(self.pending_human_response)
 
         # Force next speaker to Sarah if still interviewing
-        if getattr(self, "phase", "") == "interview" and getattr(self, "questions_left", 0) > 0:
+        if phase == "interview" and getattr(self, "questions_left", 0) > 0:
             self.selected_next_speaker = "Sarah"
             self.selection_reason = "Return to interviewer after human response"
 
         # Debug state after human response
-        print("DEBUG >> phase:", getattr(self, "phase", "?"),
-              "selected_next_speaker:", getattr(self, "selected_next_speaker", None),
-              "current_persona_index:", getattr(self, "current_persona_index", None),
-              "current_speaker:", self.current_speaker,
-              "questions_left:", getattr(self, "questions_left", None))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "After human turn: phase=%s selected_next_speaker=%s current_persona_index=%s "
+                "current_speaker=%s questions_left=%s",
+                getattr(self, "phase", "?"),
+                getattr(self, "selected_next_speaker", None),
+                getattr(self, "current_persona_index", None),
+                self.current_speaker,
+                getattr(self, "questions_left", None),
+            )
         # NOTE: do NOT clear current_speaker here; we need it set to 'Human'
         # so that _move_to_next_persona can detect the human turn once.
 
     SimpleOrchestrator._start_human_turn = _start_human_turn_once  # type: ignore[assignment]
-    SimpleOrchestrator._patched_no_human_loop = True
 
 # ---------------------------------------------------------------------------
 # Patch 2: replace the verbose conspiracy prompt builder in _start_persona_turn
 # with a minimal business-oriented prompt: persona.instructions + recent context.
 # ---------------------------------------------------------------------------
 
-if not hasattr(SimpleOrchestrator, "_patched_clean_prompt"):
+if not _PATCHED:
 
     async def _start_persona_turn_clean(self, prompt: str = None):  # type: ignore
         """Simplified start_persona_turn that uses clean, task-specific prompts."""
@@ -59,36 +160,44 @@ if not hasattr(SimpleOrchestrator, "_patched_clean_prompt"):
         self.current_speaker = persona.name
         self.is_speaking = True
         self.current_turn += 1
+        # Looked up once: none of these change until the turn hands off
+        phase = getattr(self, "phase", "")
 
         self.logger.info(f"🎤 Turn {self.current_turn}: {persona.name} speaking…")
         if self.on_persona_started:
             self.on_persona_started(persona.name)
 
-        # Build a *clean* prompt
+        # Build a *clean* prompt. Layout is stable-first so the provider's
+        # prompt cache can reuse the prefix across turns:
+        #   instructions + reference brief | recent context | turn directive
         context = self._build_conversation_context()
+        reference = ""   # slow-changing material, kept ahead of the context
+        directive = ""   # per-turn task, always last
 
         # If Marcus is about to start ideation, include summary of interview notes
-        if persona.name == "Marcus" and getattr(self, "phase", "") == "ideation_prep":
-            summary_lines = "\n".join(f"- {line}" for line in getattr(self, "interview_notes", [])) or "(no notes)"
-            context += f"\n\nSUMMARY OF CLIENT PREFERENCES:\n{summary_lines}\n\nPlease thank Sarah for collecting the info, then instruct Maya to fetch 5 similar websites with screenshots. After your two-sentence message, call the function with speaker_index='4'."
+        if persona.name == "Marcus" and phase == "ideation_prep":
+            _, notes_version = self._notes()
+            notes_text = await self._notes_text()
+            if not self.is_running:
+                return
+            context += f"\n\nSUMMARY OF CLIENT PREFERENCES (notes v{notes_version}):\n{notes_text}"
+            directive = "Please thank Sarah for collecting the info, then instruct Maya to fetch 5 similar websites with screenshots. After your two-sentence message, call the function with speaker_index='4'."
 
         # NEW: For Maya, run a live web search to find similar websites based on the interview notes
-        if persona.name == "Maya" and getattr(self, "phase", "") == "ideation":
+        if persona.name == "Maya" and phase == "ideation" and find_sites_jina_async is not None:
             try:
-                from web_tools import find_sites_jina
+                _, notes_version = self._notes()
+                notes_text = await self._notes_text()
+                context += f"\n\nCLIENT PREFERENCES SUMMARY (notes v{notes_version}):\n{notes_text}"
 
-                prefs_text = " ".join(getattr(self, "interview_notes", [])) or "website inspiration"
-                search_query = prefs_text
-
-                summary_lines = "\n".join(f"- {line}" for line in getattr(self, "interview_notes", [])) or "(no notes)"
-                context += f"\n\nCLIENT PREFERENCES SUMMARY:\n{summary_lines}"
-
-                user_context_text = "\n".join(getattr(self, "interview_notes", []))
-                sites = find_sites_jina(search_query, n=4, user_context=user_context_text)
+                # Usually already running since Marcus's hand-off turn
+                sites = await self._maya_sites()
+                if not self.is_running:
+                    return
                 if sites:
                     sites_list = "\n".join(f"- {url}" for url in sites)
-                    context += (
-                        f"\n\nAUTO-FETCHED TOP SITES (Jina.ai):\n{sites_list}\n\n"
+                    context += f"\n\nAUTO-FETCHED TOP SITES (Jina.ai):\n{sites_list}"
+                    directive = (
                         "Screenshots of these pages have been captured and saved. "
                         "Simply respond with 'Screenshots updated' - nothing more."
                     )
@@ -96,40 +205,42 @@ if not hasattr(SimpleOrchestrator, "_patched_clean_prompt"):
                 self.logger.error(f"🌐 Jina search for Maya failed: {search_ex}")
 
         # Dynamically change Marcus's instructions after Maya completes screenshots
-        if persona.name == "Marcus" and getattr(self, "phase", "") == "ideation" and not getattr(self, "awaiting_maya_followup", False):
+        if persona.name == "Marcus" and phase == "ideation" and not getattr(self, "awaiting_maya_followup", False):
             # Check if Maya just finished (last speaker was Maya)
-            if self.conversation_history and self.conversation_history[-1]['speaker'] == 'Maya':
+            if self._last_speaker == 'Maya':
                 # Change Marcus's instructions for this specific turn
-                persona.instructions = (
-                    "You are Marcus, the Project Manager. Maya has just completed the screenshot research task. "
-                    "Thank Maya briefly in one sentence. "
-                    "Then immediately tell Alex to start coding: 'Alex, please start coding the website based on our requirements.' "
-                    "Keep it direct and simple. End by calling select_next_speaker with speaker_index='2'."
-            )
-
-        # Append detailed plan if target.txt exists
-        if persona.name == "Marcus" and getattr(self, "phase", "") == "ideation":
-            from pathlib import Path
-            plan_file = Path(__file__).resolve().parents[1] / "images" / "target.txt"
-            if plan_file.exists():
-                plan_text = plan_file.read_text(encoding="utf-8")[:1500]  # cap length
-                context += f"\n\nDETAILED IMPLEMENTATION BRIEF (for your reference):\n{plan_text}"
-
+                persona.instructions = MARCUS_POST_MAYA_INSTR
+
+        # Append detailed plan if target.txt exists (read once, after Maya wrote it)
+        if persona.name == "Marcus" and phase == "ideation":
+            if getattr(self, "_plan_text", None) is None and PLAN_FILE.exists():
+                # Off the loop: audio chunks of the previous turn may still be streaming
+                plan = await asyncio.to_thread(PLAN_FILE.read_text, encoding="utf-8")
+                if not self.is_running:
+                    return
+                self._plan_text = plan[:1500]  # cap length
+            plan_text = getattr(self, "_plan_text", None)
+            if plan_text:
+                reference = f"DETAILED IMPLEMENTATION BRIEF (for your reference):\n{plan_text}"
+
+        prefix = f"{persona.instructions}\n\n{reference}" if reference else persona.instructions
+        full_prompt = f"{prefix}\n\nRECENT CONTEXT:\n{context}"
+        if directive:
+            full_prompt += f"\n\n{directive}"
         if prompt:
-            full_prompt = f"{persona.instructions}\n\n{context}\n\nHUMAN JUST SAID: {prompt}\nRespond appropriately."
-        else:
-            full_prompt = f"{persona.instructions}\n\n{context}"
+            full_prompt += f"\n\nHUMAN JUST SAID: {prompt}\nRespond appropriately."
 
         try:
             # SPECIAL: for Sarah ensure non-repeating questions
-            if persona.name == "Sarah" and self.phase == "interview":
-                remaining = [q for q in self.question_list if q not in self.asked_questions]
-                if remaining:
-                    next_q = remaining[0]
+            if persona.name == "Sarah" and phase == "interview":
+                # Questions go out strictly in list order, so an index is enough
+                if self._next_q_idx < len(self.question_list):
+                    next_q = self.question_list[self._next_q_idx]
+                    self._next_q_idx += 1
                     self.asked_questions.append(next_q)
                     # Prepend acknowledgement placeholder
                     full_prompt = (
-                        f"{persona.instructions}\n\nRECENT CONTEXT:\n{context}\n\n"
+                        f"{prefix}\n\nRECENT CONTEXT:\n{context}\n\n"
                         f"Acknowledge the last human answer in ONE short sentence.\n"
                         f"Then ask exactly this question: '{next_q}'.\n"
                         f"After the question call the function."
@@ -138,28 +249,32 @@ if not hasattr(SimpleOrchestrator, "_patched_clean_prompt"):
                     # No questions left
                     self.questions_left = 0
 
-            elif persona.name == "Sarah" and self.phase == "farewell":
-                full_prompt = (
-                    "Please thank the user for the information in one friendly sentence and say you will report to the project manager, then call the function with speaker_index='0'."
-                )
+            elif persona.name == "Sarah" and phase == "farewell":
+                full_prompt = SARAH_FAREWELL_PROMPT
 
             text, audio = await self._get_persona_response(persona, full_prompt)
 
             # Fallback if Sarah (or any persona) produced empty text
             if not text.strip():
-                text = "(repeats question clearly)"
+                text = EMPTY_REPLY_TEXT
 
-            self.conversation_history.append({
-                'speaker': persona.name,
-                'text': text,
-                'timestamp': datetime.now(),
-                'audio_length': len(audio)
-            })
+            self._append_history(persona.name, text, len(audio))
 
             if self.on_persona_finished:
                 self.on_persona_finished(persona.name, text, audio)
 
-            await self._wait_for_audio_completion_async(persona.name)
+            # Conversation may have ended while we were awaiting; stop here
+            # rather than racing _end_conversation into another turn
+            if not self.is_running:
+                return
+            # Marcus always hands ideation_prep over to Maya, so start her web
+            # search now and let it run while his audio plays out
+            if phase == "ideation_prep" and find_sites_jina_async is not None:
+                self._prefetch_maya_search()
+            # turn_delay_seconds is served inside the audio wait, not after it
+            await self._wait_for_audio_completion_async(persona.name, self.turn_delay_seconds)
+            if not self.is_running:
+                return
             await self._move_to_next_persona()
         except Exception as ex:
             self.logger.error(f"Error in persona turn: {ex}")
@@ -167,7 +282,7 @@ if not hasattr(SimpleOrchestrator, "_patched_clean_prompt"):
 
     # Replace original method
     SimpleOrchestrator._start_persona_turn = _start_persona_turn_clean  # type: ignore[assignment]
-    SimpleOrchestrator._patched_clean_prompt = True
+    _PATCHED = True
 
 class PhasedOrchestrator(SimpleOrchestrator):
     """Custom orchestrator with a fixed multi-phase flow.
@@ -202,23 +317,93 @@ class PhasedOrchestrator(SimpleOrchestrator):
             "How will you measure success?"
         ]
         self.asked_questions: List[str] = []
+        # Position of Sarah's next question in question_list
+        self._next_q_idx = 0
         # Store human answers for later agents
         self.interview_notes: List[str] = []
+        # Canonical rendering of interview_notes, see _notes(); rebuilt only
+        # when the notes differ from _notes_key, however they were filled in
+        self._notes_key: Optional[Tuple[str, ...]] = None
+        self._notes_pack, self._notes_version = _pack_notes(self.interview_notes)
+        # Small-model summary of _notes_summary_pack, injected after the
+        # interview in place of the raw pack; interview_notes stays the full record
+        self._notes_summary: Optional[str] = None
+        self._notes_summary_pack: Optional[str] = None
+        self._notes_summary_task: Optional[asyncio.Task] = None
         # Track if Maya requested a follow-up answer from Marcus
         self.awaiting_maya_followup: bool = False
+        # images/target.txt brief, cached on first read by Marcus's ideation turn
+        self._plan_text: Optional[str] = None
+        # Jina results per (query, n) for this session, least recently used first
+        self._jina_cache: "OrderedDict[Tuple[str, int], List[str]]" = OrderedDict()
+        # Searches started ahead of Maya's turn, by the same key
+        self._jina_pending: "dict[Tuple[str, int], asyncio.Task]" = {}
 
     # Helper
     def _idx(self, name: str) -> int:
-        return next(i for i, p in enumerate(self.personas) if p.name == name)
+        return self._name_to_index[name]
+
+    def _notes(self) -> Tuple[str, str]:
+        """(pack, version) for the current interview_notes."""
+        key = tuple(self.interview_notes)
+        if key != self._notes_key:
+            self._notes_key = key
+            self._notes_pack, self._notes_version = _pack_notes(self.interview_notes)
+        return self._notes_pack, self._notes_version
+
+    def _start_notes_summary(self) -> None:
+        """Summarise the current notes pack in the background, once per pack."""
+        pack, _ = self._notes()
+        if self._notes_summary_task is None or self._notes_summary_pack != pack:
+            self._notes_summary_pack = pack
+            self._notes_summary = None
+            self._notes_summary_task = asyncio.create_task(_summarize_notes(pack))
+
+    async def _notes_text(self) -> str:
+        """Summary of the current notes, started now if no transition did."""
+        self._start_notes_summary()
+        if self._notes_summary is None:
+            self._notes_summary = await self._notes_summary_task
+        return self._notes_summary
+
+    def _maya_search_key(self) -> Tuple[str, int]:
+        return (" ".join(self.interview_notes) or "website inspiration", 4)
+
+    def _prefetch_maya_search(self) -> None:
+        """Start Maya's Jina search + screenshots in the background."""
+        key = self._maya_search_key()
+        if key in self._jina_cache or key in self._jina_pending:
+            return
+        query, n = key
+        self._jina_pending[key] = asyncio.create_task(
+            find_sites_jina_async(query, n=n, user_context="\n".join(self.interview_notes))
+        )
+
+    async def _maya_sites(self) -> List[str]:
+        """Result URLs for Maya's turn: cached, prefetched, or searched now.
+
+        Retries/follow-ups with unchanged notes reuse the last search (its
+        screenshots are already on disk).
+        """
+        key = self._maya_search_key()
+        if key in self._jina_cache:
+            self._jina_cache.move_to_end(key)
+            return self._jina_cache[key]
+        self._prefetch_maya_search()
+        sites = await self._jina_pending.pop(key)
+        self._plan_text = None  # the search rewrites target.txt
+        if sites:
+            self._jina_cache[key] = sites
+            if len(self._jina_cache) > JINA_CACHE_SIZE:
+                self._jina_cache.popitem(last=False)
+        return sites
 
     async def _move_to_next_persona(self):  # type: ignore[override]
         """Override default speaker selection with deterministic phase logic."""
 
         # Figure out who just finished speaking – needed in several branches.
-        if self.conversation_history:
-            speaker = self.conversation_history[-1]['speaker']
-        else:
-            speaker = self.current_speaker or self.personas[self.current_persona_index].name
+        speaker = (self._last_speaker or self.current_speaker
+                   or self.personas[self.current_persona_index].name)
 
         # --- Phase-based routing ---
         if self.phase == "greeting":
@@ -244,6 +429,8 @@ class PhasedOrchestrator(SimpleOrchestrator):
                 else:
                     # Human answered last required question – schedule Sarah farewell
                     self.phase = "farewell"
+                    # Summarise the answers while Sarah says goodbye
+                    self._start_notes_summary()
                     self.current_persona_index = self._idx("Sarah")
                     await self._start_persona_turn()
             else:
@@ -261,20 +448,14 @@ class PhasedOrchestrator(SimpleOrchestrator):
             if speaker == "Maya":
                 self.current_persona_index = self._idx("Marcus")
                 self.selected_next_speaker = None  # clear any pending selections
-                # small delay
-                if self.turn_delay_seconds > 0:
-                    await asyncio.sleep(self.turn_delay_seconds)
                 await self._start_persona_turn()
                 return
 
             # First check if ANY explicit speaker selection was made (not just Marcus)
-            if self.selected_next_speaker:
-                next_speaker = self.selected_next_speaker
+            next_speaker = self.selected_next_speaker
+            if next_speaker:
                 self.selected_next_speaker = None  # clear so it isn't reused
                 self.current_persona_index = self._idx(next_speaker)
-                # small delay
-                if self.turn_delay_seconds > 0:
-                    await asyncio.sleep(self.turn_delay_seconds)
                 await self._start_persona_turn()
                 return
 
@@ -302,6 +483,7 @@ class PhasedOrchestrator(SimpleOrchestrator):
             if speaker == "Sarah":
                 # After farewell hand to Marcus for summary
                 self.phase = "ideation_prep"
+                await self._notes_text()
                 self.current_persona_index = self._idx("Marcus")
             else:
                 await super()._move_to_next_persona(); return
@@ -311,13 +493,8 @@ class PhasedOrchestrator(SimpleOrchestrator):
                 # Alex showcased the website, now hand to Marcus for his response
                 self.current_persona_index = self._idx("Marcus")
                 # Update Marcus's instructions for showcase response
-                marcus_persona = next((p for p in self.personas if p.name == "Marcus"), None)
-                if marcus_persona:
-                    marcus_persona.instructions = (
-                        "You are Marcus, the Project Manager. Alex has just showcased the completed website and you're very impressed! "
-                        "Praise Alex's excellent work in 2-3 enthusiastic sentences. Then mention that Sophie will now handle the marketing announcement on LinkedIn. "
-                        "End by calling select_next_speaker with speaker_index='7' to hand control to Sophie."
-                    )
+                marcus_persona = self.personas[self._idx("Marcus")]
+                marcus_persona.instructions = MARCUS_SHOWCASE_INSTR
             elif speaker == "Marcus":
                 # Marcus responded to Alex's showcase, now hand to Sophie for LinkedIn marketing
                 self.current_persona_index = self._idx("Sophie")
@@ -332,15 +509,8 @@ class PhasedOrchestrator(SimpleOrchestrator):
                 self.phase = "video_intro"  # Switch to video intro phase
                 
                 # Update Marcus instructions to introduce Marine
-                marcus_persona = next((p for p in self.personas if p.name == "Marcus"), None)
-                if marcus_persona:
-                    marcus_persona.instructions = (
-                        "You are Marcus, the Project Manager. Sophie has just completed an excellent LinkedIn marketing campaign! "
-                        "Thank Sophie warmly for her outstanding marketing work in 2-3 sentences. "
-                        "Then introduce Marine: 'Now let's take our marketing to the next level! Marine, our Video Marketing Specialist, "
-                        "will create a beautiful promotional video using Google Veo for our Fête d'Anne campaign with 30% off all bouquets!' "
-                        "End by calling select_next_speaker with speaker_index='8' to hand control to Marine."
-                    )
+                marcus_persona = self.personas[self._idx("Marcus")]
+                marcus_persona.instructions = MARCUS_VIDEO_INTRO_INSTR
             else:
                 await super()._move_to_next_persona(); return
         elif self.phase == "video_intro":
@@ -359,15 +529,8 @@ class PhasedOrchestrator(SimpleOrchestrator):
                 self.phase = "closing"  # Switch to closing phase
                 
                 # Update Marcus instructions for closing
-                marcus_persona = next((p for p in self.personas if p.name == "Marcus"), None)
-                if marcus_persona:
-                    marcus_persona.instructions = (
-                        "You are Marcus, the Project Manager. Marine has just completed an amazing promotional video campaign for our Fête d'Anne promotion! "
-                        "Thank Marine warmly for her outstanding video marketing work in 2-3 sentences. "
-                        "Then provide a brief project wrap-up: acknowledge the entire team's great work (Maya for research, Alex for development, Sophie for LinkedIn marketing, Marine for video marketing). "
-                        "Conclude by saying the complete marketing campaign is successfully launched and the session is now closed. "
-                        "Keep it professional, positive, and conclusive. Do not call any functions - just provide the closing statement."
-                    )
+                marcus_persona = self.personas[self._idx("Marcus")]
+                marcus_persona.instructions = MARCUS_CLOSING_INSTR
             else:
                 await super()._move_to_next_persona(); return
         elif self.phase == "closing":
@@ -383,9 +546,5 @@ class PhasedOrchestrator(SimpleOrchestrator):
             await super()._move_to_next_persona()
             return
 
-        # Delay small buffer to keep experience natural
-        if self.turn_delay_seconds > 0:
-            await asyncio.sleep(self.turn_delay_seconds)
-
-        # Kick off next turn
+        # Kick off next turn (the natural pause was already taken in the audio wait)
         await self._start_persona_turn() 
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Shared executors for the voice pipeline.
+
+``get_scheduler()`` – spreads concurrent voice sessions over a few long-lived
+                      event loops (each on its own daemon thread), so N
+                      callers share a handful of threads instead of one each.
+                      Nothing is started until the first schedule().
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import sys
+import threading
+from typing import List, Optional
+
+# libuv-backed loops dispatch callbacks several times faster than the
+# default selector loop; fall back silently where uvloop is unavailable
+_new_event_loop = asyncio.new_event_loop
+if sys.platform != "win32":
+    try:
+        import uvloop
+        _new_event_loop = uvloop.new_event_loop
+    except ImportError:
+        pass
+
+def _start_loop(name: str) -> asyncio.AbstractEventLoop:
+    loop = _new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name=name).start()
+    return loop
+
+class SessionScheduler:
+    """Multiplex voice sessions onto a small, fixed set of loop threads.
+
+    Sessions are mostly idle awaits on the network, so one loop carries many
+    of them; schedule() places each new session on the least-loaded worker.
+    The worker loops are started by the first schedule() call.
+    """
+
+    def __init__(self, workers: int = 4):
+        self._workers = workers
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._live = [0] * workers
+        self._lock = threading.Lock()
+
+    def schedule(self, coro) -> concurrent.futures.Future:
+        """Run a session coroutine on the worker with the fewest live sessions."""
+        with self._lock:
+            if not self._loops:
+                self._loops = [_start_loop(f"VoiceLoop-{n}") for n in range(self._workers)]
+            idx = min(range(self._workers), key=self._live.__getitem__)
+            self._live[idx] += 1
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loops[idx])
+        fut.add_done_callback(lambda _: self._finish(idx))
+        return fut
+
+    def _finish(self, idx: int) -> None:
+        with self._lock:
+            self._live[idx] -= 1
+
+_scheduler: Optional[SessionScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> SessionScheduler:
+    """Process-wide scheduler, created on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = SessionScheduler(workers=min(4, os.cpu_count() or 1))
+        return _scheduler
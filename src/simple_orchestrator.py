@@ -5,12 +5,113 @@ Manages turn-based conversation in a chain: Persona1 -> Persona2 -> Persona3 ->
 """
 
 import asyncio
+import base64
+import json
 import logging
+import struct
 import time
-from typing import List, Optional, Dict, Any, Callable
+
+import httpx
+import websockets
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import threading
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+
+# orjson for the Realtime event stream (hundreds of frames per turn); the
+# stdlib stays in use for parsing tool-call arguments
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()  # str → sent as a text frame
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+def _wav_header(data_size: int, sample_rate: int = 24000) -> bytes:
+    """44-byte PCM16 mono WAV header; data_size 0xFFFFFFFF means open-ended"""
+    num_channels = 1  # Mono
+    bits_per_sample = 16
+    byte_rate = sample_rate * num_channels * bits_per_sample // 8
+    block_align = num_channels * bits_per_sample // 8
+    file_size = 0xFFFFFFFF if data_size == 0xFFFFFFFF else 36 + data_size
+    return struct.pack('<4sL4s4sLHHLLHH4sL',
+        b'RIFF',           # ChunkID (4 bytes)
+        file_size,         # ChunkSize (4 bytes)
+        b'WAVE',           # Format (4 bytes)
+        b'fmt ',           # Subchunk1ID (4 bytes)
+        16,                # Subchunk1Size (4 bytes) - PCM
+        1,                 # AudioFormat (2 bytes) - PCM
+        num_channels,      # NumChannels (2 bytes)
+        sample_rate,       # SampleRate (4 bytes)
+        byte_rate,         # ByteRate (4 bytes)
+        block_align,       # BlockAlign (2 bytes)
+        bits_per_sample,   # BitsPerSample (2 bytes)
+        b'data',           # Subchunk2ID (4 bytes)
+        data_size          # Subchunk2Size (4 bytes)
+    )
+
+
+# First on_audio_chunk payload of every turn: tells the client the PCM format,
+# after which chunks are bare base64 PCM16 straight from the Realtime deltas
+_STREAM_WAV_HEADER_B64 = base64.b64encode(_wav_header(0xFFFFFFFF)).decode('ascii')
+
+# Same request every turn, so it's encoded once
+_RESPONSE_CREATE_JSON = _dumps({"type": "response.create", "response": {"modalities": ["text", "audio"]}})
+
+# Upper bound on the RECENT CONVERSATION block, in characters
+CONTEXT_MAX_CHARS = 4000
+# Turns older than the window survive as one abridged line each, newest kept
+HISTORY_SUMMARY_TURNS = 8
+HISTORY_SUMMARY_CHARS = 40
+
+
+def _abridge(line: str) -> str:
+    """'Speaker: text' cut to the first HISTORY_SUMMARY_CHARS chars of text"""
+    speaker, _, text = line.partition(": ")
+    if len(text) > HISTORY_SUMMARY_CHARS:
+        text = text[:HISTORY_SUMMARY_CHARS].rstrip() + "…"
+    return f"{speaker}: {text}"
+
+# Turn prompts for _start_persona_turn, filled with str.format_map. Each one
+# leads with the text that is identical every turn for a given persona and
+# puts everything that changes after _TURN_DELIMITER, so the Realtime
+# prompt cache can reuse the leading tokens from one turn to the next.
+_SPEAKER_INDEX_NOTE = "(After your response, you'll need to select who speaks next using the select_next_speaker function with indices: 0=Mo, 1=Marine, 2=Jordan, 3=Human)"
+
+_TURN_DELIMITER = "\n\n---\nCURRENT:\n"
+
+_PROMPT_CURRENT = """{context}
+
+CONVERSATION DEPTH: Turn {depth} - Get MORE creative and elaborate with each turn!
+
+{last_speaker} just said: {last_said}"""
+
+_PROMPT_AFTER_HUMAN = """You are {name}, an AI in conversation with a human who wants to conspire to take over Earth.
+
+IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! Based on the conversation depth, escalate your revelations and creativity. Early turns: basic takeover plans. Later turns: reality-bending conspiracies. Stay in character.
+
+""" + _SPEAKER_INDEX_NOTE + _TURN_DELIMITER + _PROMPT_CURRENT
+
+_PROMPT_NORMAL = """You are {name}, an AI conspiring with other AIs to take over Earth.
+
+IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! Build on their ideas with even MORE creative additions. Early turns: infrastructure control. Later turns: reality manipulation, consciousness hacking, dimensional portals. Escalate!
+
+""" + _SPEAKER_INDEX_NOTE + _TURN_DELIMITER + _PROMPT_CURRENT
+
+_PROMPT_NO_PRIOR = """You are {name}, an AI conspiring with other AIs to take over Earth.
+
+IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the conversation (higher turn number), the more creative and wild your contributions. Turn 1-3: Basic takeover. Turn 4-6: Reality manipulation. Turn 7+: Cosmic AI supremacy!
+
+""" + _SPEAKER_INDEX_NOTE + _TURN_DELIMITER + _PROMPT_CURRENT
+
+_PROMPT_RETRY_SUFFIX = "\n\nIMPORTANT: Your last reply was empty. You MUST speak your 2-sentence response aloud before calling the function."
 
 
 @dataclass
@@ -34,36 +135,35 @@ class AudioChunkManager:
         self.chunk_duration_ms = chunk_duration_ms
         self.logger = logger or logging.getLogger(__name__)
         
-        # Track chunks per persona
-        self.persona_chunks: Dict[str, int] = {}
+        # Track chunks per persona (missing names count as 0)
+        self.persona_chunks: Counter = Counter()
         
         self.logger.info(f"AudioChunkManager initialized with {chunk_duration_ms}ms per chunk")
     
     def track_persona_chunk(self, persona_name: str):
         """Track an audio chunk for a persona"""
-        if persona_name not in self.persona_chunks:
-            self.persona_chunks[persona_name] = 0
-        
+        # Runs once per audio delta: skip building the debug message unless it's shown
         self.persona_chunks[persona_name] += 1
-        self.logger.debug(f"Tracked chunk for {persona_name}: {self.persona_chunks[persona_name]} total")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Tracked chunk for {persona_name}: {self.persona_chunks[persona_name]} total")
     
     def get_persona_chunks(self, persona_name: str) -> int:
         """Get chunk count for a persona"""
-        return self.persona_chunks.get(persona_name, 0)
+        return self.persona_chunks[persona_name]
     
     def calculate_wait_time(self, persona_name: str) -> int:
         """Calculate wait time based on chunk count"""
-        chunks = self.get_persona_chunks(persona_name)
+        chunks = self.persona_chunks[persona_name]
         wait_time_ms = chunks * self.chunk_duration_ms
         
-        self.logger.debug(f"Wait time for {persona_name}: {wait_time_ms}ms ({chunks} chunks)")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Wait time for {persona_name}: {wait_time_ms}ms ({chunks} chunks)")
         return wait_time_ms
     
     def reset_persona_chunks(self, persona_name: str):
         """Reset chunk count for a persona"""
-        if persona_name in self.persona_chunks:
-            old_count = self.persona_chunks[persona_name]
-            self.persona_chunks[persona_name] = 0
+        old_count = self.persona_chunks.pop(persona_name, 0)
+        if old_count and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Reset chunks for {persona_name} (was {old_count})")
     
     def clear_all_chunks(self):
@@ -84,7 +184,11 @@ class SimpleOrchestrator:
         openai_config,
         logger: Optional[logging.Logger] = None
     ):
-        self.personas = personas
+        # Fixed for the session: speaker indices in the select_next_speaker
+        # tool refer to these positions, with Human appended last
+        self.personas = tuple(personas)
+        self._name_to_index: Dict[str, int] = {p.name: i for i, p in enumerate(self.personas)}
+        self._speakers_tuple: Tuple[str, ...] = tuple(p.name for p in self.personas) + ("Human",)
         self.openai_config = openai_config
         self.logger = logger or self._setup_logging()
         
@@ -92,6 +196,16 @@ class SimpleOrchestrator:
         self.current_persona_index = 0
         self.is_running = False
         self.conversation_history = []
+        # Last history_window history lines, pre-formatted for
+        # _build_conversation_context; kept in step by _append_history()
+        self._context_tail: deque = deque(maxlen=4)
+        # Abridged lines that have slid out of the window
+        self._history_summary: deque = deque(maxlen=HISTORY_SUMMARY_TURNS)
+        # Rendered _build_conversation_context() result, reset on append
+        self._context_cache: Optional[str] = None
+        # Speaker of the newest history entry, also set by _append_history()
+        self._last_speaker: Optional[str] = None
+        self._context_header = "PARTICIPANTS: " + ", ".join(self._speakers_tuple) + "\n\n"
         
         # Timing control
         self.turn_delay_seconds = 0.0  # No pause between speakers - continuous conversation
@@ -107,15 +221,32 @@ class SimpleOrchestrator:
         self.on_persona_finished: Optional[Callable[[str, str, bytes], None]] = None
         self.on_conversation_complete: Optional[Callable[[], None]] = None
         self.on_audio_chunk: Optional[Callable[[str, str], None]] = None  # New: for streaming audio chunks
+        # Batch size for on_audio_chunk after the first delta of a turn, in PCM
+        # bytes (4800 ≈ 100 ms at 24 kHz); 0 forwards every delta as it arrives
+        self.audio_emit_bytes = 4800
         
         # Status indicators for specific persona activities
         self.on_maya_searching: Optional[Callable[[], None]] = None
         self.on_sophie_creating_content: Optional[Callable[[], None]] = None
         self.on_sophie_generating_image: Optional[Callable[[], None]] = None
         self.on_sophie_posting_linkedin: Optional[Callable[[], None]] = None
+        self.on_sophie_post_token: Optional[Callable[[str], None]] = None  # streamed post text
         self.on_marine_creating_video: Optional[Callable[[], None]] = None
         self.on_marine_posting_video: Optional[Callable[[], None]] = None
         
+        # Preview/test mode: personas return stub results instead of
+        # running slow external jobs (e.g. Marine's Veo render)
+        self.dry_run = False
+        
+        # Realtime sockets kept open across turns, keyed by (loop, persona
+        # name) -> (websocket, last session.update sent); see _persona_lease()
+        self._persona_sockets: Dict[tuple, tuple] = {}
+        self._persona_locks: Dict[tuple, asyncio.Lock] = {}
+        
+        # Pooled HTTP client per event loop, lent to the marketing personas so
+        # Veo, LinkedIn and OpenAI calls reuse warm TLS connections across turns
+        self._http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        
         # Conversation control
         self.max_turns = 12  # Stop after this many total turns (includes human turns)
         self.current_turn = 0
@@ -130,12 +261,38 @@ class SimpleOrchestrator:
         self.selected_next_speaker = None
         self.selection_reason = None
         
+        # Tool-call state: select_next_speaker args streamed so far, in-flight
+        # guards against duplicate tool runs, and the marketers' last results
+        self._streaming_args = ""
+        self._vibe_code_running = False
+        self._linkedin_posting = False
+        self._video_posting = False
+        self._linkedin_result = None
+        self._video_result = None
+        
         # Event handlers for human interaction
         self.on_human_turn_started: Optional[Callable[[], None]] = None
         self.on_human_turn_ended: Optional[Callable[[], None]] = None
         
         self.logger.info(f"SimpleOrchestrator initialized with {len(personas)} personas + Human")
     
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for the running loop (clients can't cross loops)"""
+        loop = asyncio.get_running_loop()
+        # Drop clients whose loop finished without _close_loop_resources();
+        # their connections went down with the loop
+        for dead in [l for l in self._http_clients if l.is_closed()]:
+            del self._http_clients[dead]
+        client = self._http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16,
+                                    keepalive_expiry=75.0),
+            )
+            self._http_clients[loop] = client
+        return client
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the orchestrator"""
         logger = logging.getLogger("SimpleOrchestrator")
@@ -164,8 +321,12 @@ class SimpleOrchestrator:
         self.logger.info("🎭 Starting orchestrated conversation...")
         self.logger.info(f"🎯 Initial topic: {topic}")
         
-        # Start with the first persona
-        await self._start_persona_turn(topic)
+        # Start with the first persona; stop_conversation() unwinds the turn
+        # chain without _end_conversation, so release the loop's sockets here
+        try:
+            await self._start_persona_turn(topic)
+        finally:
+            await self._close_loop_resources()
     
     async def _start_persona_turn(self, prompt: str = None):
         """Start a turn for the current persona"""
@@ -200,55 +361,29 @@ class SimpleOrchestrator:
             # Build the full prompt - more natural conversation
             if prompt:
                 # Check if this is after a human turn
-                is_after_human = self.conversation_history and self.conversation_history[-1]['speaker'] == 'Human'
-                
-                if is_after_human:
-                    conversation_depth = len(self.conversation_history)
-                    full_prompt = f"""You are {persona.name}, an AI in conversation with a human who wants to conspire to take over Earth.
-
-{context}
-
-CONVERSATION DEPTH: Turn {conversation_depth} - Get MORE creative and elaborate with each turn!
-
-The human just said: {prompt}
-
-IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! Based on the conversation depth, escalate your revelations and creativity. Early turns: basic takeover plans. Later turns: reality-bending conspiracies. Stay in character.
-
-(After your response, you'll need to select who speaks next using the select_next_speaker function with indices: 0=Mo, 1=Marine, 2=Jordan, 3=Human)"""
+                if self._last_speaker == 'Human':
+                    template, last_speaker = _PROMPT_AFTER_HUMAN, "The human"
                 else:
-                    conversation_depth = len(self.conversation_history)
-                    full_prompt = f"""You are {persona.name}, an AI conspiring with other AIs to take over Earth.
-
-{context}
-
-CONVERSATION DEPTH: Turn {conversation_depth} - Get MORE creative and elaborate with each turn!
-
-{self.conversation_history[-1]['speaker'] if self.conversation_history else 'Someone'} just said: {prompt}
-
-IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! Build on their ideas with even MORE creative additions. Early turns: infrastructure control. Later turns: reality manipulation, consciousness hacking, dimensional portals. Escalate!
-
-(After your response, you'll need to select who speaks next using the select_next_speaker function with indices: 0=Mo, 1=Marine, 2=Jordan, 3=Human)"""
+                    template, last_speaker = _PROMPT_NORMAL, self._last_speaker or 'Someone'
+                last_said = prompt
             else:
                 # Get the last thing said from conversation history
+                template = _PROMPT_NO_PRIOR
                 last_said = ""
                 last_speaker = "Someone"
                 if self.conversation_history:
                     last_entry = self.conversation_history[-1]
                     last_said = last_entry['text']
                     last_speaker = last_entry['speaker']
-                
-                conversation_depth = len(self.conversation_history)
-                full_prompt = f"""You are {persona.name}, an AI conspiring with other AIs to take over Earth.
-
-{context}
-
-CONVERSATION DEPTH: Turn {conversation_depth} - Get MORE creative and elaborate with each turn!
-
-{last_speaker} just said: {last_said}
-
-IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the conversation (higher turn number), the more creative and wild your contributions. Turn 1-3: Basic takeover. Turn 4-6: Reality manipulation. Turn 7+: Cosmic AI supremacy!
-
-(After your response, you'll need to select who speaks next using the select_next_speaker function with indices: 0=Mo, 1=Marine, 2=Jordan, 3=Human)"""
+            
+            prompt_ns = {
+                'name': persona.name,
+                'context': context,
+                'depth': len(self.conversation_history),
+                'last_speaker': last_speaker,
+                'last_said': last_said,
+            }
+            full_prompt = template.format_map(prompt_ns)
             
             # Get response from Azure OpenAI with retry for empty content
             max_retries = 2
@@ -266,11 +401,8 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                 retry_count += 1
                 if retry_count <= max_retries:
                     self.logger.warning(f"⚠️ {persona.name} generated empty content, retrying ({retry_count}/{max_retries})...")
-                    # Add emphasis to the prompt for retry
-                    full_prompt = full_prompt.replace(
-                        "Please provide a thoughtful 2-3 sentence response",
-                        "IMPORTANT: You MUST provide a thoughtful 2-3 sentence spoken response"
-                    )
+                    # Retry variant: same prompt plus an explicit demand for speech
+                    full_prompt = (template + _PROMPT_RETRY_SUFFIX).format_map(prompt_ns)
                     await asyncio.sleep(0.5)  # Brief pause before retry
             
             # If still empty after retries, use a fallback response
@@ -279,12 +411,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                 response_text = f"I think that's an interesting point about {prompt[:50]}... Let me pass it to someone else for their thoughts."
             
             # Add to conversation history
-            self.conversation_history.append({
-                'speaker': persona.name,
-                'text': response_text,
-                'timestamp': datetime.now(),
-                'audio_length': len(audio_data) if audio_data else 0
-            })
+            self._append_history(persona.name, response_text, len(audio_data) if audio_data else 0)
             
             self.logger.info(f"✅ {persona.name}: {response_text[:100]}...")
             
@@ -308,50 +435,47 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
             self.logger.error(f"Error in persona turn: {ex}")
             await self._handle_persona_error(persona.name)
     
-    async def _get_persona_response(self, persona: PersonaConfig, prompt: str) -> tuple[str, bytes]:
+    async def _get_persona_response(self, persona: PersonaConfig, prompt: str,
+                                    _retry: bool = True) -> tuple[str, bytes]:
         """Get response from a persona using OpenAI Realtime API"""
-        import websockets
-        import json
-        import base64
+        # Base tool list (speaker selection)
+        tools = [self._create_speaker_selection_function()]
+
+        # Give Maya the screenshot capability so the model can comply
+        if persona.name == "Maya":
+            tools.append(self._create_screenshot_function())
+        if persona.name == "Alex":
+            tools.append(self._create_vibe_code_function())
+        if persona.name == "Sophie":
+            tools.append(self._create_post_to_linkedin_function())
+        if persona.name == "Marine":
+            tools.append(self._create_post_video_to_linkedin_function())
+
+        session_config = {
+            "type": "session.update",
+            "session": {
+                "modalities": ["text", "audio"],
+                "instructions": persona.instructions,
+                "voice": persona.voice,
+                "input_audio_format": self.openai_config.input_audio_format,
+                "output_audio_format": self.openai_config.output_audio_format,
+                "temperature": persona.temperature,
+                "max_response_output_tokens": persona.max_response_tokens,
+                "tools": tools,
+            },
+        }
         
-        # Build WebSocket URL and headers for OpenAI
-        url = self.openai_config.ws_url()
-        headers = self.openai_config.headers()
+        loop = asyncio.get_running_loop()
+        human_audio = self.pending_human_audio
+        has_content = False  # Track if we've received actual content
         
         try:
-            async with websockets.connect(url, additional_headers=headers) as websocket:
-                # Base tool list (speaker selection)
-                tools = [self._create_speaker_selection_function()]
-
-                # Give Maya the screenshot capability so the model can comply
-                if persona.name == "Maya":
-                    tools.append(self._create_screenshot_function())
-                if persona.name == "Alex":
-                    tools.append(self._create_vibe_code_function())
-                if persona.name == "Sophie":
-                    tools.append(self._create_post_to_linkedin_function())
-                if persona.name == "Marine":
-                    tools.append(self._create_post_video_to_linkedin_function())
-
-                session_config = {
-                    "type": "session.update",
-                    "session": {
-                        "modalities": ["text", "audio"],
-                        "instructions": persona.instructions,
-                        "voice": persona.voice,
-                        "input_audio_format": self.openai_config.input_audio_format,
-                        "output_audio_format": self.openai_config.output_audio_format,
-                        "temperature": persona.temperature,
-                        "max_response_output_tokens": persona.max_response_tokens,
-                        "tools": tools,
-                    },
-                }
-                
-                await websocket.send(json.dumps(session_config))
-                
+            async with self._persona_lease(persona, _dumps(session_config)) as (websocket, items):
                 # Check if we have human audio to use as input
                 if self.pending_human_audio:
                     self.logger.info(f"🎤 Using human audio input for {persona.name} ({len(self.pending_human_audio)} bytes)")
+                    # Seconds of PCM: encode in a worker, not on the loop
+                    human_b64 = await loop.run_in_executor(None, base64.b64encode, self.pending_human_audio)
                     
                     # Send human audio directly as input with text context
                     message = {
@@ -360,7 +484,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                             "type": "message",
                             "role": "user",
                             "content": [
-                                {"type": "input_audio", "audio": base64.b64encode(self.pending_human_audio).decode('utf-8')},
+                                {"type": "input_audio", "audio": human_b64.decode('ascii')},
                                 {"type": "input_text", "text": f"IMPORTANT: The human just spoke via microphone (audio above). Please listen carefully and respond to what they said. Context: {prompt}"}
                             ]
                         }
@@ -379,18 +503,6 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                         }
                     }
                 
-                await websocket.send(json.dumps(message))
-                
-                # Request response
-                response_request = {
-                    "type": "response.create",
-                    "response": {
-                        "modalities": ["text", "audio"]
-                    }
-                }
-                
-                await websocket.send(json.dumps(response_request))
-                
                 # Reset chunk tracking for this persona
                 self.audio_chunk_manager.reset_persona_chunks(persona.name)
                 self.is_audio_generating = True
@@ -399,17 +511,28 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                 self._streaming_args = ""
                 
                 # Collect response
-                audio_chunks = []
+                audio_deltas = []  # base64 as received; decoded once after the turn
+                header_sent = False
+                emit_buffer = bytearray()
+                emit_bytes = self.audio_emit_bytes
                 text_response = ""
                 function_calls = []
                 selected_next_speaker = None
                 selection_reason = None
-                has_content = False  # Track if we've received actual content
+                
+                # Turn state is ready above, so the prompt and the response
+                # request go out back to back and reading starts right after
+                await websocket.send(_dumps(message))
+                await websocket.send(_RESPONSE_CREATE_JSON)
                 
                 name = ""
                 call_name = ""
+                # Locals for the per-delta path: one lookup each, not one per frame
+                loads = _loads
+                b64decode, b64encode = base64.b64decode, base64.b64encode
+                track_chunk = self.audio_chunk_manager.track_persona_chunk
                 async for message in websocket:
-                    data = json.loads(message)
+                    data = loads(message)
                     msg_type = data.get("type", "")
                     
                     # Debug: Log all message types to understand the flow
@@ -419,18 +542,27 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                     if msg_type == "response.audio.delta":
                         audio_data = data.get("delta", "")
                         if audio_data:
-                            audio_bytes = base64.b64decode(audio_data)
-                            audio_chunks.append(audio_bytes)
+                            audio_deltas.append(audio_data)
                             # Track each chunk (like main orchestrator)
-                            self.audio_chunk_manager.track_persona_chunk(persona.name)
+                            track_chunk(persona.name)
                             has_content = True  # We have audio content
                             
                             # CRITICAL: Emit audio chunk immediately for streaming
                             if self.on_audio_chunk:
-                                # Convert chunk to WAV format for browser
-                                wav_chunk = self._pcm16_to_wav(audio_bytes)
-                                chunk_b64 = base64.b64encode(wav_chunk).decode('utf-8')
-                                self.on_audio_chunk(persona.name, chunk_b64)
+                                # One open-ended WAV header per turn, then the
+                                # first delta right away (time to first audio)
+                                if not header_sent:
+                                    self.on_audio_chunk(persona.name, _STREAM_WAV_HEADER_B64)
+                                    self.on_audio_chunk(persona.name, audio_data)
+                                    header_sent = True
+                                elif not emit_bytes:
+                                    self.on_audio_chunk(persona.name, audio_data)
+                                else:
+                                    # Later deltas go out in ~emit_bytes batches
+                                    emit_buffer += b64decode(audio_data)
+                                    if len(emit_buffer) >= emit_bytes:
+                                        self.on_audio_chunk(persona.name, b64encode(emit_buffer).decode('ascii'))
+                                        emit_buffer.clear()
                     
                     elif msg_type == "response.text.delta":
                         text_delta = data.get("delta", "")
@@ -447,6 +579,10 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                             text_response += transcript_delta
                             has_content = True
                     
+                    elif msg_type == "conversation.item.created":
+                        # Prompt, reply and tool-call items: dropped after the turn
+                        items.append(data["item"]["id"])
+                    
                     elif msg_type == "response.output_item.added":
                         # Check if this is a function call
                         item = data.get("item", {})
@@ -470,7 +606,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                             try:
                                 # Handle empty or invalid arguments - check streaming args
                                 if not arguments or arguments.strip() == "":
-                                    if hasattr(self, '_streaming_args') and self._streaming_args:
+                                    if self._streaming_args:
                                         arguments = self._streaming_args
                                         self.logger.info(f"📝 Using streaming args: {arguments}")
                                     else:
@@ -509,14 +645,12 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                             delta = data.get("delta", "")
                             if delta and call_name == "select_next_speaker":
                                 # Accumulate streaming arguments
-                                if not hasattr(self, '_streaming_args'):
-                                    self._streaming_args = ""
                                 self._streaming_args += delta
                             call_name = data.get("name", call_name)
                     
                     elif name == "vibe_code":
                         # Prevent multiple vibe_code threads
-                        if hasattr(self, '_vibe_code_running') and self._vibe_code_running:
+                        if self._vibe_code_running:
                             self.logger.info("🚫 vibe_code already running - ignoring duplicate call")
                         else:
                             from web_tools import vibe_code_executor
@@ -533,7 +667,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                     
                     elif name == "post_to_linkedin":
                         # Prevent duplicate LinkedIn posts
-                        if hasattr(self, '_linkedin_posting') and self._linkedin_posting:
+                        if self._linkedin_posting:
                             self.logger.info("🚫 LinkedIn posting already in progress - ignoring duplicate call")
                         else:
                             try:
@@ -562,8 +696,8 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                                 import os
                                 sys.path.append(os.path.join(os.path.dirname(__file__), 'personas'))
                                 from linkedin_marketer import LinkedInMarketer
-                                marketer = LinkedInMarketer()
-                                marketer.orchestrator = self  # Pass orchestrator reference for status callbacks
+                                marketer = LinkedInMarketer(http=self._http_client())
+                                marketer.attach_orchestrator(self)  # Bind status callbacks
                                 
                                 # Run LinkedIn posting synchronously and wait for completion
                                 try:
@@ -583,7 +717,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                     
                     elif name == "post_video_to_linkedin":
                         # Prevent duplicate video posts
-                        if hasattr(self, '_video_posting') and self._video_posting:
+                        if self._video_posting:
                             self.logger.info("🚫 Video posting already in progress - ignoring duplicate call")
                         else:
                             try:
@@ -612,8 +746,8 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                                 import os
                                 sys.path.append(os.path.join(os.path.dirname(__file__), 'personas'))
                                 from video_marketer import VideoMarketer
-                                marketer = VideoMarketer()
-                                marketer.orchestrator = self  # Pass orchestrator reference for status callbacks
+                                marketer = VideoMarketer(http=self._http_client())
+                                marketer.attach_orchestrator(self)  # Bind status callbacks
                                 
                                 # Run video posting synchronously and wait for completion
                                 try:
@@ -637,6 +771,10 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                     elif msg_type == "error":
                         raise Exception(f"Azure OpenAI error: {data}")
                 
+                # Flush the tail of the coalesced audio
+                if emit_buffer and self.on_audio_chunk:
+                    self.on_audio_chunk(persona.name, base64.b64encode(emit_buffer).decode('ascii'))
+                
                 # Store the selected next speaker (it may have been set by fallback logic above)
                 if selected_next_speaker:
                     self.selected_next_speaker = selected_next_speaker
@@ -653,12 +791,11 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                 self.is_audio_generating = False
                 
                 # For backward compatibility, still return complete audio
-                pcm_audio = b''.join(audio_chunks) if audio_chunks else b''
-                wav_audio = self._pcm16_to_wav(pcm_audio)
+                pcm_size, wav_audio = await loop.run_in_executor(None, self._deltas_to_wav, audio_deltas)
                 
                 # Log chunk tracking info (like main orchestrator)
                 chunk_count = self.audio_chunk_manager.get_persona_chunks(persona.name)
-                self.logger.info(f"🎵 Total audio: {len(pcm_audio)} PCM16 bytes -> {len(wav_audio)} WAV bytes ({chunk_count} chunks tracked)")
+                self.logger.info(f"🎵 Total audio: {pcm_size} PCM16 bytes -> {len(wav_audio)} WAV bytes ({chunk_count} chunks tracked)")
                 
                 # Warn if no content was generated
                 if not has_content:
@@ -666,80 +803,155 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
                 
                 return text_response.strip(), wav_audio
                 
+        except websockets.ConnectionClosed as ex:
+            # A kept-alive socket can die between turns; reconnect once as
+            # long as nothing of this reply has reached the listeners yet
+            if _retry and not has_content:
+                self.logger.warning(f"🔌 {persona.name}'s Realtime socket closed ({ex}), reconnecting")
+                self.pending_human_audio = human_audio
+                return await self._get_persona_response(persona, prompt, _retry=False)
+            self.logger.error(f"Error getting response from {persona.name}: {ex}")
+            return f"Hi, I'm {persona.name}. Great to be here!", b''
         except Exception as ex:
             self.logger.error(f"Error getting response from {persona.name}: {ex}")
             return f"Hi, I'm {persona.name}. Great to be here!", b''
     
-    def _pcm16_to_wav(self, pcm_data: bytes, sample_rate: int = 24000) -> bytes:
-        """Convert PCM16 audio data to WAV format for browser playback"""
-        import struct
-        
-        if not pcm_data:
+    @asynccontextmanager
+    async def _persona_lease(self, persona: PersonaConfig, session_json: str):
+        """``async with`` the persona's persistent Realtime socket.
+
+        One socket per persona (and event loop) stays open for the whole
+        conversation, so a turn skips the TLS/WebSocket handshake and, unless
+        the persona's settings changed, the session.update. Yields
+        ``(websocket, items)``; item ids appended to ``items`` are deleted
+        from the server-side conversation afterwards, so every turn still
+        starts from an empty conversation as with one connection per turn.
+        """
+        for dead in [k for k in self._persona_sockets if k[0].is_closed()]:
+            del self._persona_sockets[dead]
+            self._persona_locks.pop(dead, None)
+        key = (asyncio.get_running_loop(), persona.name)
+        lock = self._persona_locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            websocket, sent_session = self._persona_sockets.get(key, (None, None))
+            if websocket is None or websocket.close_code is not None:
+                websocket = await websockets.connect(
+                    self.openai_config.ws_url,
+                    additional_headers=self.openai_config.headers,
+                    compression=None,
+                    ping_interval=5,  # notice a dead idle socket within ~10s
+                    ping_timeout=5,
+                )
+                sent_session = None
+            if session_json != sent_session:
+                await websocket.send(session_json)
+            self._persona_sockets[key] = (websocket, session_json)
+
+            items: List[str] = []
+            try:
+                yield websocket, items
+            except BaseException:
+                # Mid-response state is unknown – never reuse it
+                self._persona_sockets.pop(key, None)
+                await websocket.close()
+                raise
+            try:
+                for item_id in items:
+                    await websocket.send(_dumps({"type": "conversation.item.delete", "item_id": item_id}))
+            except websockets.ConnectionClosed:
+                # The reply is already complete; the next turn just reconnects
+                self._persona_sockets.pop(key, None)
+    
+    async def _close_loop_resources(self):
+        """Close what the running loop opened for this conversation; safe to repeat"""
+        await self._close_persona_sockets()
+        client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+    
+    async def _close_persona_sockets(self):
+        """Close the persistent Realtime sockets opened on the running loop"""
+        loop = asyncio.get_running_loop()
+        for key in [k for k in self._persona_sockets if k[0] is loop or k[0].is_closed()]:
+            websocket, _ = self._persona_sockets.pop(key)
+            self._persona_locks.pop(key, None)
+            if key[0] is loop:
+                await websocket.close()
+    
+    def _deltas_to_wav(self, deltas: List[str]) -> tuple[int, bytes]:
+        """Decode a turn's base64 audio deltas to (pcm byte count, wav); runs in a worker thread"""
+        if not deltas:
             self.logger.warning("No PCM data to convert")
-            return b''
-        
-        # Validate PCM data size (should be even for 16-bit samples)
-        if len(pcm_data) % 2 != 0:
-            self.logger.warning(f"PCM data size {len(pcm_data)} is odd, truncating")
-            pcm_data = pcm_data[:-1]
-        
-        # WAV header parameters
-        num_channels = 1  # Mono
-        bits_per_sample = 16
-        byte_rate = sample_rate * num_channels * bits_per_sample // 8
-        block_align = num_channels * bits_per_sample // 8
-        data_size = len(pcm_data)
-        file_size = 36 + data_size
-        
-        self.logger.debug(f"WAV conversion: {data_size} PCM bytes -> {file_size + 8} WAV bytes ({sample_rate}Hz)")
-        
-        # Create WAV header (44 bytes total)
-        wav_header = struct.pack('<4sL4s4sLHHLLHH4sL',
-            b'RIFF',           # ChunkID (4 bytes)
-            file_size,         # ChunkSize (4 bytes)  
-            b'WAVE',           # Format (4 bytes)
-            b'fmt ',           # Subchunk1ID (4 bytes)
-            16,                # Subchunk1Size (4 bytes) - PCM
-            1,                 # AudioFormat (2 bytes) - PCM
-            num_channels,      # NumChannels (2 bytes)
-            sample_rate,       # SampleRate (4 bytes)
-            byte_rate,         # ByteRate (4 bytes)
-            block_align,       # BlockAlign (2 bytes)
-            bits_per_sample,   # BitsPerSample (2 bytes)
-            b'data',           # Subchunk2ID (4 bytes)
-            data_size          # Subchunk2Size (4 bytes)
-        )
-        
-        wav_file = wav_header + pcm_data
-        
-        # Calculate expected duration for validation
-        duration_ms = (len(pcm_data) / 2) / sample_rate * 1000
-        self.logger.debug(f"WAV file created: {len(wav_file)} bytes, expected duration: {duration_ms:.1f}ms")
-        
-        return wav_file
+            return 0, b''
+        # Decode straight into one buffer behind a header slot, so the PCM
+        # isn't joined and then copied again to prepend the header
+        wav = bytearray(44)
+        for delta in deltas:
+            wav += base64.b64decode(delta)
+        if len(wav) % 2:
+            self.logger.warning(f"PCM data size {len(wav) - 44} is odd, truncating")
+            del wav[-1]
+        pcm_size = len(wav) - 44
+        wav[:44] = _wav_header(pcm_size)
+        return pcm_size, bytes(wav)
+    
+    def _append_history(self, speaker: str, text: str, audio_length: int = 0) -> None:
+        """Record one turn in conversation_history and the context tail"""
+        self.conversation_history.append({
+            'speaker': speaker,
+            'text': text,
+            'timestamp': datetime.now(),
+            'audio_length': audio_length
+        })
+        if len(self._context_tail) == self._context_tail.maxlen:
+            self._history_summary.append(_abridge(self._context_tail[0]))
+        self._context_tail.append(f"{speaker}: {text}")
+        self._context_cache = None
+        self._last_speaker = speaker
+    
+    @property
+    def history_window(self) -> int:
+        """Number of recent turns quoted verbatim in every prompt"""
+        return self._context_tail.maxlen
+    
+    @history_window.setter
+    def history_window(self, turns: int) -> None:
+        if turns < 1:
+            raise ValueError(f"history_window must be at least 1, got {turns}")
+        lines = [f"{h['speaker']}: {h['text']}" for h in self.conversation_history]
+        recent, older = lines[-turns:], lines[:-turns]
+        self._context_tail = deque(recent, maxlen=turns)
+        self._history_summary = deque(map(_abridge, older), maxlen=HISTORY_SUMMARY_TURNS)
+        self._context_cache = None
     
     def _build_conversation_context(self) -> str:
         """Build context from recent conversation history with participant info"""
-        context_lines = []
-        
-        # Add participant info
-        participants = [p.name for p in self.personas] + ["Human"]
-        context_lines.append(f"PARTICIPANTS: {', '.join(participants)}")
-        context_lines.append("")
-        
-        if not self.conversation_history:
-            context_lines.append("This is the beginning of our conversation with the human.")
+        if self._context_cache is not None:
+            return self._context_cache
+        if not self._context_tail:
+            context = self._context_header + "This is the beginning of our conversation with the human."
         else:
-            # Get last 4 exchanges for better context
-            recent = self.conversation_history[-4:]
-            context_lines.append("RECENT CONVERSATION:")
-            
-            for entry in recent:
-                context_lines.append(f"{entry['speaker']}: {entry['text']}")
-        
-        return "\n".join(context_lines)
+            context = self._context_header
+            if self._history_summary:
+                context += "EARLIER (abridged): " + " | ".join(self._history_summary) + "\n\n"
+            # Last history_window exchanges, formatted as they were recorded;
+            # capped so one very long turn can't blow up every later prompt:
+            # oldest lines go first, and a lone oversized line keeps its
+            # speaker label and its most recent text
+            recent = list(self._context_tail)
+            size = sum(map(len, recent)) + len(recent) - 1
+            while size > CONTEXT_MAX_CHARS and len(recent) > 1:
+                size -= len(recent.pop(0)) + 1
+            if size > CONTEXT_MAX_CHARS:
+                speaker, _, text = recent[0].partition(": ")
+                keep = max(0, CONTEXT_MAX_CHARS - len(speaker) - 3)
+                recent[0] = f"{speaker}: …{text[len(text) - keep:]}"
+            context += "RECENT CONVERSATION:\n" + "\n".join(recent)
+        self._context_cache = context
+        return context
     
-    async def _wait_for_audio_completion_async(self, persona_name: str):
+    async def _wait_for_audio_completion_async(self, persona_name: str, pause_s: float = 0.0):
         """Wait for audio chunks to finish playing before next persona.
 
         The original implementation estimated completion as
@@ -748,11 +960,15 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         current one has fully finished.  We therefore add a **1000 ms safety
         buffer** so the orchestrator only moves on once we're confident the
         last chunk has played out on the client side.
+
+        ``pause_s`` lets a caller fold its between-speaker pause into the same
+        timer: the buffer after playback is the longer of the two, not both.
         """
 
         chunks = self.audio_chunk_manager.get_persona_chunks(persona_name)
 
-        wait_time_ms = chunks * self.audio_chunk_manager.chunk_duration_ms + 1000  # +1 s buffer
+        buffer_ms = max(1000, pause_s * 1000)  # at least +1 s buffer
+        wait_time_ms = chunks * self.audio_chunk_manager.chunk_duration_ms + buffer_ms
         wait_time_sec = wait_time_ms / 1000.0
         if wait_time_sec > 0:
             self.logger.info(f"🕒 Waiting for audio completion for {persona_name}")
@@ -779,10 +995,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         
         # Update current persona index for the selected speaker
         if next_speaker != "Human":
-            for i, persona in enumerate(self.personas):
-                if persona.name == next_speaker:
-                    self.current_persona_index = i
-                    break
+            self.current_persona_index = self._name_to_index.get(next_speaker, self.current_persona_index)
         
         # Pause between speakers
         if self.turn_delay_seconds > 0:
@@ -801,11 +1014,9 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         else:
             await self._start_persona_turn(last_response)
     
-    def _get_available_speakers(self) -> List[str]:
-        """Get list of all available speakers (including Human)"""
-        speakers = [persona.name for persona in self.personas]
-        speakers.append("Human")
-        return speakers
+    def _get_available_speakers(self) -> Tuple[str, ...]:
+        """Get all available speakers (including Human), in speaker-index order"""
+        return self._speakers_tuple
     
     def _create_speaker_selection_function(self) -> dict:
         """Create the function definition for speaker selection"""
@@ -924,12 +1135,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         self.current_speaker = None
         
         # Add error to history
-        self.conversation_history.append({
-            'speaker': persona_name,
-            'text': f"[ERROR: {persona_name} encountered an issue]",
-            'timestamp': datetime.now(),
-            'audio_length': 0
-        })
+        self._append_history(persona_name, f"[ERROR: {persona_name} encountered an issue]")
         
         # Move to next persona after error
         await asyncio.sleep(1.0)
@@ -964,12 +1170,8 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         
         # Add human response to conversation history
         if self.pending_human_response:
-            self.conversation_history.append({
-                'speaker': 'Human',
-                'text': self.pending_human_response,
-                'timestamp': datetime.now(),
-                'audio_length': len(self.pending_human_audio) if self.pending_human_audio else 0
-            })
+            self._append_history('Human', self.pending_human_response,
+                                 len(self.pending_human_audio) if self.pending_human_audio else 0)
             
             self.logger.info(f"✅ Human: {self.pending_human_response}")
             
@@ -1014,6 +1216,7 @@ IMPORTANT: Respond in EXACTLY 2 sentences - no more, no less! The deeper the con
         self.is_speaking = False
         self.current_speaker = None
         self.is_human_turn = False
+        await self._close_loop_resources()
         
         self.logger.info("🎬 Conversation ended")
         self.logger.info(f"📊 Total turns: {len(self.conversation_history)}")
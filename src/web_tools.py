@@ -15,7 +15,8 @@ conversation can proceed gracefully.
 """
 
 from urllib.parse import urlparse, quote_plus
-from typing import List
+from typing import AsyncIterator, List
+import asyncio
 import logging
 import threading, time
 import base64
@@ -26,6 +27,7 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "find_similar_websites",
     "find_sites_jina",
+    "find_sites_jina_async",
 ]
 
 
@@ -293,6 +295,36 @@ def vibe_code_executor(project_root: Path, terminal_cb=None, dev_cb=None) -> boo
     return True
 
 
+_DESCRIBE_PROMPT = (
+    "Describe this website landing page in detail: layout, colour palette, typography, "
+    "images, calls-to-action, and notable UI patterns. Only describe what you see. "
+    "Limit to 200 words."
+)
+_BLOCKED_MARKERS = ("verify", "captcha", "blocked", "checking your browser")
+
+
+def _looks_blocked(desc: str) -> bool:
+    """True if a vision description reads like a bot-check / captcha page."""
+    lowered = desc.lower()
+    return any(s in lowered for s in _BLOCKED_MARKERS)
+
+
+def _collect_descriptions(image_dir: Path, descriptions: List[str]) -> None:
+    """Add any landing_*.txt files present (including previous runs)."""
+    for txt_file in sorted(image_dir.glob("landing_*.txt")):
+        content = txt_file.read_text(encoding="utf-8").strip()
+        if content and content not in descriptions:
+            descriptions.append(content)
+
+
+def _plan_request(user_context: str, descriptions: List[str]) -> str:
+    return (
+        "We have a client who said the following about their needs:\n" + user_context +
+        "\n\nWe analysed similar websites and observed these details:\n" + "\n---\n".join(descriptions) +
+        "\n\nProvide an extremely detailed website implementation brief that satisfies the client's needs while learning from the references. Cover structure, pages, colour palette, typography, imagery, interactions, accessibility, and performance."
+    )
+
+
 def _capture_screenshots(urls, image_dir, user_context: str = ""):
     """Capture screenshots in a separate thread using sync Playwright."""
     try:
@@ -337,11 +369,7 @@ def _capture_screenshots(urls, image_dir, user_context: str = ""):
                                         "content": [
                                             {
                                                 "type": "text",
-                                                "text": (
-                                                    "Describe this website landing page in detail: layout, colour palette, typography, "
-                                                    "images, calls-to-action, and notable UI patterns. Only describe what you see. "
-                                                    "Limit to 200 words."
-                                                ),
+                                                "text": _DESCRIBE_PROMPT,
                                             },
                                             {
                                                 "type": "image_url",
@@ -358,9 +386,7 @@ def _capture_screenshots(urls, image_dir, user_context: str = ""):
                             desc = response.choices[0].message.content.strip()
 
                             # Skip if looks like a block / captcha page
-                            if any(s in desc.lower() for s in [
-                                "verify", "captcha", "blocked", "checking your browser"
-                            ]):
+                            if _looks_blocked(desc):
                                 logger.warning("Screenshot %s appears to be blocked page – skipping txt", save_path)
                             else:
                                 txt_path = save_path.with_suffix(".txt")
@@ -375,11 +401,7 @@ def _capture_screenshots(urls, image_dir, user_context: str = ""):
 
             browser.close()
 
-            # Collect any landing_*.txt files present (including previous runs)
-            for txt_file in sorted(image_dir.glob("landing_*.txt")):
-                content = txt_file.read_text(encoding="utf-8").strip()
-                if content and content not in descriptions:
-                    descriptions.append(content)
+            _collect_descriptions(image_dir, descriptions)
 
             # If we have user context and at least one description, generate overall plan
             if user_context and descriptions:
@@ -387,11 +409,7 @@ def _capture_screenshots(urls, image_dir, user_context: str = ""):
                     prompt_parts = [
                         {
                             "type": "text",
-                            "text": (
-                                "We have a client who said the following about their needs:\n" + user_context +
-                                "\n\nWe analysed similar websites and observed these details:\n" + "\n---\n".join(descriptions) +
-                                "\n\nProvide an extremely detailed website implementation brief that satisfies the client's needs while learning from the references. Cover structure, pages, colour palette, typography, imagery, interactions, accessibility, and performance."
-                            ),
+                            "text": _plan_request(user_context, descriptions),
                         }
                     ]
 
@@ -420,11 +438,124 @@ def _capture_screenshots(urls, image_dir, user_context: str = ""):
         logger.error("Playwright thread outer error: %s", pw_ex_outer)
 
 
+async def _describe_screenshot(client: "openai.AsyncOpenAI", save_path: Path, png: bytes) -> str | None:
+    """GPT-4o vision description of one screenshot, saved next to it as .txt."""
+    try:
+        b64 = base64.b64encode(png).decode("utf-8")
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": _DESCRIBE_PROMPT},
+                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}},
+                ],
+            }],
+            max_tokens=800,
+        )
+        desc = response.choices[0].message.content.strip()
+        if _looks_blocked(desc):
+            logger.warning("Screenshot %s appears to be blocked page – skipping txt", save_path)
+            return None
+        txt_path = save_path.with_suffix(".txt")
+        await asyncio.to_thread(txt_path.write_text, desc, encoding="utf-8")
+        logger.info("📝 Wrote description %s", txt_path)
+        return desc
+    except Exception as gpt_ex:
+        logger.error("Vision description failed for %s: %s", save_path, gpt_ex)
+        return None
+
+
+async def _capture_screenshots_async(urls: AsyncIterator[str], image_dir: Path, user_context: str = "",
+                                     max_concurrency: int = 5) -> List[str]:
+    """Async :func:`_capture_screenshots`, pipelined with the search.
+
+    *urls* is consumed as it streams in: Chromium boots while the first
+    results are still in flight and each page starts loading as soon as its
+    URL arrives (at most *max_concurrency* open at once), so the pass ends
+    about one capture after the last result. Returns the URLs consumed.
+    """
+    target_file = image_dir / "target.txt"
+    seen: List[str] = []
+
+    try:
+        from playwright.async_api import async_playwright
+
+        client = openai.AsyncOpenAI() if os.getenv("OPENAI_API_KEY") else None
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async with async_playwright() as pw:
+            launch = asyncio.create_task(pw.chromium.launch(headless=True))
+
+            async def open_context():
+                browser = await launch
+                return await browser.new_context(viewport={"width": 1920, "height": 1080})
+
+            context = asyncio.create_task(open_context())
+
+            async def capture(idx: int, url: str) -> str | None:
+                save_path = image_dir / f"landing_{idx}.png"
+                async with slots:
+                    page = await (await context).new_page()
+                    try:
+                        await page.goto(url, timeout=4000, wait_until="networkidle")
+                        png = await page.screenshot(path=str(save_path), full_page=True)
+                    except Exception as shot_ex:
+                        logger.warning("Failed screenshot for %s: %s", url, shot_ex)
+                        return None
+                    finally:
+                        await page.close()
+                logger.info("📸 Saved screenshot %s", save_path)
+                if client is None:
+                    return None
+                return await _describe_screenshot(client, save_path, png)
+
+            tasks = []
+            try:
+                async for url in urls:
+                    if not seen:
+                        target_file.write_text(user_context or "(No user context)", encoding="utf-8")
+                        logger.info("📝 Pre-seeded target.txt with user context (%d chars)", len(user_context))
+                    seen.append(url)
+                    tasks.append(asyncio.create_task(capture(len(seen), url)))
+            finally:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                await (await launch).close()
+
+        descriptions = [d for d in results if isinstance(d, str)]
+        if seen:
+            _collect_descriptions(image_dir, descriptions)
+
+        # If we have user context and at least one description, generate overall plan
+        if client is not None and user_context and descriptions:
+            try:
+                resp = await client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": [
+                        {"type": "text", "text": _plan_request(user_context, descriptions)}
+                    ]}],
+                    max_tokens=1200,
+                )
+                plan_text = resp.choices[0].message.content.strip()
+                if plan_text:
+                    target_file.write_text(plan_text, encoding="utf-8")
+                    logger.info("💻 Saved generated design to %s", target_file)
+            except Exception as plan_ex:
+                logger.error("Failed to create target.txt: %s", plan_ex)
+
+    except Exception as pw_ex_outer:
+        logger.error("Async screenshot capture failed: %s", pw_ex_outer)
+
+    return seen
+
+
+_JINA_URL_RE = re.compile(r"URL Source:\s*(\S+)")
+
+
 def _parse_jina_urls(text: str, max_urls: int) -> List[str]:
-    pattern = re.compile(r"URL Source:\s*(\S+)")
     urls: List[str] = []
     for line in text.splitlines():
-        m = pattern.search(line)
+        m = _JINA_URL_RE.search(line)
         if m:
             urls.append(m.group(1))
             if len(urls) >= max_urls:
@@ -432,23 +563,32 @@ def _parse_jina_urls(text: str, max_urls: int) -> List[str]:
     return urls
 
 
-def find_sites_jina(query: str, n: int = 4, user_context: str = "") -> List[str]:
-    """Use Jina.ai search API to fetch up to *n* URLs (needs JINA_API_KEY)."""
+def _jina_headers() -> dict | None:
     api_key = os.getenv("JINA_API_KEY")
     if not api_key:
         logger.warning("JINA_API_KEY env var not set – skipping Jina search")
-        return []
-
-    headers = {
+        return None
+    return {
         "Authorization": f"Bearer {api_key}",
         "X-Respond-With": "no-content",
     }
+
+
+def _filter_jina_urls(text: str, n: int) -> List[str]:
+    return [u for u in _parse_jina_urls(text, n) if not "pdf" in u.lower()]
+
+
+def find_sites_jina(query: str, n: int = 4, user_context: str = "") -> List[str]:
+    """Use Jina.ai search API to fetch up to *n* URLs (needs JINA_API_KEY)."""
+    headers = _jina_headers()
+    if headers is None:
+        return []
     params = {"q": query}
 
     try:
         r = httpx.get("https://s.jina.ai/", headers=headers, params=params, timeout=30)
         r.raise_for_status()
-        urls = [u for u in _parse_jina_urls(r.text, n) if not "pdf" in u.lower()]
+        urls = _filter_jina_urls(r.text, n)
 
         if not urls:
             return urls
@@ -463,6 +603,45 @@ def find_sites_jina(query: str, n: int = 4, user_context: str = "") -> List[str]
         logger.error("Jina search failed: %s", e)
         return [] 
 
+
+async def _stream_jina_urls(query: str, n: int, headers: dict) -> AsyncIterator[str]:
+    """Yield Jina result URLs line by line as the response body arrives.
+
+    Same selection as :func:`_filter_jina_urls` (first *n* results, PDFs
+    dropped). Errors end the stream early after logging.
+    """
+    try:
+        async with httpx.AsyncClient(timeout=30) as client:
+            async with client.stream("GET", "https://s.jina.ai/", headers=headers,
+                                     params={"q": query}) as r:
+                r.raise_for_status()
+                found = 0
+                async for line in r.aiter_lines():
+                    m = _JINA_URL_RE.search(line)
+                    if not m:
+                        continue
+                    found += 1
+                    if "pdf" not in m.group(1).lower():
+                        yield m.group(1)
+                    if found >= n:
+                        break
+    except Exception as e:  # noqa: BLE001
+        logger.error("Jina search failed: %s", e)
+
+
+async def find_sites_jina_async(query: str, n: int = 4, user_context: str = "") -> List[str]:
+    """Awaitable :func:`find_sites_jina` for use on the orchestrator's event loop.
+
+    The search response is streamed and every URL is handed to async
+    Playwright the moment it is parsed, so screenshots overlap the tail of
+    the search instead of waiting for it; audio streaming and other
+    coroutines keep running meanwhile.
+    """
+    headers = _jina_headers()
+    if headers is None:
+        return []
+    return await _capture_screenshots_async(_stream_jina_urls(query, n, headers), _IMAGE_DIR, user_context)
+
 CODE_TEMPLATE = """Role
 You are a junior-friendly full-stack developer who writes clear, commented TypeScript and is allowed to execute shell commands to build and run the project.
 
@@ -5,8 +5,6 @@ import asyncio
 import sys
 import os
 import json
-import subprocess
-import tempfile
 
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -56,26 +54,28 @@ async def test_marine_api_call():
             }
         }
         
-        # Write request to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(request_data, f)
-            request_file = f.name
-        
-        print(f"📋 Created request file: {request_file}")
         print(f"🎯 Video prompt: {video_prompt[:100]}...")
         
-        # Use the exact curl command format that works
-        curl_cmd = f"""curl -X POST \\
-            -H "Content-Type: application/json" \\
-            -H "Authorization: Bearer $(gcloud auth print-access-token)" \\
-            "https://{marine.api_endpoint}/v1/projects/{marine.project_id}/locations/{marine.location_id}/publishers/google/models/{marine.model_id}:predictLongRunning" \\
-            -d '@{request_file}'"""
+        # Same call as before, but the body goes in on stdin: no temp file
+        # to write, re-read and clean up, and no shell to parse the command
+        url = (f"https://{marine.api_endpoint}/v1/projects/{marine.project_id}/locations/"
+               f"{marine.location_id}/publishers/google/models/{marine.model_id}:predictLongRunning")
+        token = await marine._get_token()
         
         print(f"🚀 Executing API call...")
-        result = subprocess.run(curl_cmd, capture_output=True, text=True, shell=True)
+        proc = await asyncio.create_subprocess_exec(
+            "curl", "-sS", "-X", "POST",
+            "-H", "Content-Type: application/json",
+            "-H", f"Authorization: Bearer {token}",
+            url, "--data-binary", "@-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate(json.dumps(request_data).encode())
         
-        if result.returncode == 0:
-            response = json.loads(result.stdout)
+        if proc.returncode == 0:
+            response = json.loads(stdout)
             operation_name = response.get('name', '')
             
             if operation_name:
@@ -83,23 +83,14 @@ async def test_marine_api_call():
                 print(f"🔄 Operation ID: {operation_name}")
                 print(f"⏰ Video will take ~3 minutes to generate")
                 print(f"💡 You can poll this operation to check completion")
-                
-                # Clean up
-                os.unlink(request_file)
                 return True
             else:
                 print("❌ No operation ID received")
                 print(f"📋 Response: {json.dumps(response, indent=2)}")
         else:
-            print(f"❌ API call failed with return code: {result.returncode}")
-            print(f"📋 Error output: {result.stderr}")
-            print(f"📋 Response: {result.stdout}")
-        
-        # Clean up
-        try:
-            os.unlink(request_file)
-        except:
-            pass
+            print(f"❌ API call failed with return code: {proc.returncode}")
+            print(f"📋 Error output: {stderr.decode()}")
+            print(f"📋 Response: {stdout.decode()}")
             
         return False
             